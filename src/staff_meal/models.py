@@ -1,5 +1,6 @@
 """Domain models for meal order verification."""
 
+from collections.abc import Iterable, Mapping
 from datetime import datetime
 from enum import Enum
 
@@ -106,6 +107,10 @@ class Order(BaseModel):
         """Total quantity of all items."""
         return sum(item.quantity for item in self.items)
 
+    def items_by_name(self) -> Mapping[str, int]:
+        """Quantity per item name."""
+        return {item.item.value: item.quantity for item in self.items}
+
 
 class ItemMismatch(BaseModel):
     """Item quantity mismatch information."""
@@ -147,6 +152,11 @@ class ComparisonResult(BaseModel):
     )
 
 
+def _join_mismatches(mismatches: Iterable[ItemMismatch]) -> str:
+    """Join mismatches as "<expected>x <item>" entries."""
+    return ", ".join(f"{m.expected_quantity}x {m.item.value}" for m in mismatches)
+
+
 class ValidationRecord(BaseModel):
     """Record of a validation result stored in the database."""
 
@@ -159,6 +169,40 @@ class ValidationRecord(BaseModel):
     detected_order: Order = Field(..., description="Detected order")
     comparison_result: ComparisonResult = Field(..., description="Comparison result")
 
+    def error_count(self) -> int:
+        """Total number of item errors in the comparison result."""
+        result = self.comparison_result
+        return (
+            len(result.missing_items)
+            + len(result.too_few_items)
+            + len(result.too_many_items)
+            + len(result.extra_items)
+        )
+
+    def expected_items_summary(self) -> str:
+        """Expected items joined as "<qty>x <item>" entries."""
+        return ", ".join(str(item) for item in self.expected_order.items)
+
+    def detected_items_summary(self) -> str:
+        """Detected items joined as "<qty>x <item>" entries."""
+        return ", ".join(str(item) for item in self.detected_order.items)
+
+    def missing_items_summary(self) -> str:
+        """Missing items joined as "<expected>x <item>" entries."""
+        return _join_mismatches(self.comparison_result.missing_items)
+
+    def too_few_items_summary(self) -> str:
+        """Under-quantity items joined as "<expected>x <item>" entries."""
+        return _join_mismatches(self.comparison_result.too_few_items)
+
+    def too_many_items_summary(self) -> str:
+        """Over-quantity items joined as "<expected>x <item>" entries."""
+        return _join_mismatches(self.comparison_result.too_many_items)
+
+    def extra_items_summary(self) -> str:
+        """Unexpected items joined as "<qty>x <item>" entries."""
+        return ", ".join(str(item) for item in self.comparison_result.extra_items)
+
 
 class Statistics(BaseModel):
     """Aggregated statistics from validation records."""
@@ -1,5 +1,6 @@
 """Order storage service for saving orders to Supabase."""
 
+from datetime import datetime
 from typing import Any, cast
 
 from staff_meal.database import get_supabase_client
@@ -30,25 +31,32 @@ async def save_order(order: Order) -> None:
     supabase.table("orders").insert(data).execute()
 
 
-async def get_all_orders(limit: int = 100) -> list[Order]:
+async def get_all_orders(
+    limit: int = 100, before: datetime | None = None
+) -> list[Order]:
     """Get all saved orders from Supabase database.
 
+    Pages are fetched by keyset rather than offset: pass the created_at of the
+    oldest order already loaded as ``before`` to get the next, older page.
+
     Args:
         limit: Maximum number of orders to return.
+        before: Optional cursor; only orders created strictly before it are returned.
 
     Returns:
         List of Order objects, ordered by created_at DESC.
     """
     supabase = get_supabase_client()
 
-    # Query orders table, ordered by created_at descending
-    response = (
-        supabase.table("orders")
-        .select("*")
-        .order("created_at", desc=True)
-        .limit(limit)
-        .execute()
-    )
+    # Build query
+    query = supabase.table("orders").select("*")
+
+    # Apply keyset cursor
+    if before:
+        query = query.lt("created_at", before.isoformat())
+
+    # Order by created_at descending and limit
+    response = query.order("created_at", desc=True).limit(limit).execute()
 
     # Convert response to Order objects
     orders: list[Order] = []
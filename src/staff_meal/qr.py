@@ -1,20 +1,85 @@
 """QR code service for encoding and decoding orders."""
 
 import json
+from collections.abc import Iterator
 from pathlib import Path
 
 import qrcode  # type: ignore[import-untyped]
 import zxingcpp  # type: ignore[import-not-found]
-from PIL import Image
+from PIL import Image, ImageFilter, ImageOps
 
 from staff_meal.models import Item, Order, OrderItem, OrderSource
 
+# Extra scales tried on the binarized image when the raw photo does not decode
+_RETRY_SCALES = (2.0, 0.5, 1.5)
 
-def decode_qr(image_path: str | Path) -> Order:
+
+def _otsu_threshold(histogram: list[int]) -> int:
+    """Compute Otsu's binarization threshold from a 256-bin grayscale histogram.
+
+    Args:
+        histogram: Pixel counts per gray level, as returned by Image.histogram().
+
+    Returns:
+        Gray level maximizing the between-class variance; pixels above it are light.
+    """
+    total = sum(histogram)
+    weighted_total = sum(level * count for level, count in enumerate(histogram))
+
+    background = 0
+    background_sum = 0
+    best_threshold = 0
+    best_variance = 0.0
+    for level, count in enumerate(histogram):
+        background += count
+        if background == 0:
+            continue
+        foreground = total - background
+        if foreground == 0:
+            break
+        background_sum += level * count
+        background_mean = background_sum / background
+        foreground_mean = (weighted_total - background_sum) / foreground
+        variance = background * foreground * (background_mean - foreground_mean) ** 2
+        if variance > best_variance:
+            best_variance = variance
+            best_threshold = level
+    return best_threshold
+
+
+def _preprocessed_variants(image: Image.Image) -> Iterator[Image.Image]:
+    """Yield a bounded sequence of cleaned-up versions of a QR photo.
+
+    Variants are produced lazily, cheapest first: Otsu binarization, its
+    inversion, rescaled copies, then erosion and dilation of the modules.
+
+    Args:
+        image: Image that failed to decode as-is.
+
+    Yields:
+        Preprocessed images to retry decoding on.
+    """
+    gray = ImageOps.grayscale(image)
+    threshold = _otsu_threshold(gray.histogram())
+    binary = gray.point([0] * (threshold + 1) + [255] * (255 - threshold))
+
+    yield binary
+    yield ImageOps.invert(binary)
+    for scale in _RETRY_SCALES:
+        size = (
+            max(1, round(binary.width * scale)),
+            max(1, round(binary.height * scale)),
+        )
+        yield binary.resize(size, Image.Resampling.BILINEAR)
+    yield binary.filter(ImageFilter.MinFilter(3))
+    yield binary.filter(ImageFilter.MaxFilter(3))
+
+
+def decode_qr(image: str | Path | Image.Image) -> Order:
     """Decode QR code from image and return Order object.
 
     Args:
-        image_path: Path to QR code image file.
+        image: Path to QR code image file, or an already loaded PIL Image.
 
     Returns:
         Order object parsed from QR code data.
@@ -22,11 +87,20 @@ def decode_qr(image_path: str | Path) -> Order:
     Raises:
         ValueError: If QR code cannot be decoded or data is invalid.
     """
-    image = Image.open(image_path)
-    results = zxingcpp.read_barcodes(image)
+    # In-memory images are decoded directly, with no temp file round trip
+    pil_image = image if isinstance(image, Image.Image) else Image.open(image)
+    results = zxingcpp.read_barcodes(pil_image)
+
+    # Blurry or poorly lit photos often decode once cleaned up; stop at the first hit
+    if not results:
+        for variant in _preprocessed_variants(pil_image):
+            results = zxingcpp.read_barcodes(variant)
+            if results:
+                break
 
     if not results:
-        msg = f"No QR code found in image: {image_path}"
+        location = "" if isinstance(image, Image.Image) else f": {image}"
+        msg = f"No QR code found in image{location}"
         raise ValueError(msg)
 
     # Get first QR code data
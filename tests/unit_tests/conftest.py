@@ -0,0 +1,11 @@
+"""Shared fixtures for unit tests."""
+
+import pytest
+
+from ui.services.client_config import _create_client_cached
+
+
+@pytest.fixture(autouse=True)
+def _clear_client_cache() -> None:
+    """Drop cached clients so each test sees its own patched create_client."""
+    _create_client_cached.clear()
@@ -1,8 +1,12 @@
 """Tests for dashboard component."""
 
+import io
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+from openpyxl import load_workbook
+
 from staff_meal.models import (
     ComparisonResult,
     Item,
@@ -16,6 +20,10 @@ from staff_meal.models import (
 )
 from ui.components.dashboard import (
     _create_csv_export,
+    _create_excel_export,
+    _filtered_indices,
+    _lttb_indices,
+    _parse_insights,
     _render_error_analysis_charts,
     _render_formatted_insights,
     _render_item_analysis_charts,
@@ -134,6 +142,49 @@ class TestRenderFormattedInsights:
         mock_error.assert_not_called()
         mock_warning.assert_not_called()
 
+    @patch("ui.components.dashboard.st.markdown")
+    @patch("ui.components.dashboard.st.error")
+    @patch("ui.components.dashboard._parse_insights", wraps=_parse_insights)
+    @patch("ui.components.dashboard.st.session_state", new_callable=dict)
+    def test_parsed_insights_are_reused(
+        self,
+        mock_session_state: dict,
+        mock_parse: MagicMock,
+        mock_error: MagicMock,
+        mock_markdown: MagicMock,
+    ) -> None:
+        """Parse the same insights text only once across reruns."""
+        insights = "🔴 CRITIQUE: Sauce oubliée 15x"
+        _render_formatted_insights(insights)
+        _render_formatted_insights(insights)
+
+        mock_parse.assert_called_once_with(insights)
+        assert mock_error.call_count == 2
+
+
+class TestLttbIndices:
+    """Tests for _lttb_indices function."""
+
+    def test_short_series_is_kept(self) -> None:
+        """Keep every point when the series is already small enough."""
+        x = np.arange(10, dtype=np.float64)
+        indices = _lttb_indices(x, x, 20)
+
+        assert indices.tolist() == list(range(10))
+
+    def test_downsample_keeps_endpoints_and_peak(self) -> None:
+        """Downsample to the requested size while keeping endpoints and spikes."""
+        x = np.arange(1000, dtype=np.float64)
+        y = np.zeros(1000)
+        y[500] = 100.0
+        indices = _lttb_indices(x, y, 50)
+
+        assert len(indices) == 50
+        assert indices[0] == 0
+        assert indices[-1] == 999
+        assert 500 in indices
+        assert np.all(np.diff(indices) > 0)
+
 
 class TestRenderTrendCharts:
     """Tests for _render_trend_charts function."""
@@ -524,3 +575,97 @@ class TestCreateCsvExport:
         assert "ORD-1" in csv_data
         assert "ORD-2" in csv_data
         assert "RÉSUMÉ" in csv_data  # Summary section should be present
+
+
+class TestCreateExcelExport:
+    """Tests for _create_excel_export function."""
+
+    def test_create_excel_export_rows_and_summary(self) -> None:
+        """Write styled header, one row per record and the summary block."""
+        order = Order(
+            order_id="ORD-789",
+            source=OrderSource.UBER_EATS,
+            items=[OrderItem(item=Item.GYOZA, quantity=2)],
+        )
+        record = ValidationRecord(
+            id=7,
+            order_id="ORD-789",
+            timestamp=datetime(2024, 1, 15, 12, 0, 0),
+            operator="Alice",
+            is_complete=True,
+            expected_order=order,
+            detected_order=order,
+            comparison_result=ComparisonResult(
+                is_complete=True,
+                missing_items=[],
+                too_few_items=[],
+                too_many_items=[],
+                extra_items=[],
+                matched_items=[],
+            ),
+        )
+
+        stats = calculate_statistics([record])
+        excel_data = _create_excel_export([record], stats)
+
+        ws = load_workbook(io.BytesIO(excel_data))["Validations"]
+        rows = [[cell.value for cell in row] for row in ws.iter_rows()]
+        assert rows[0][0] == "ID"
+        assert ws["A1"].font.bold
+        assert rows[1][1] == "ORD-789"
+        assert rows[1][5] == "Lundi"
+        assert rows[3][0] == "RÉSUMÉ"
+        assert rows[4][:2] == ["Total commandes", 1]
+
+    def test_create_excel_export_without_records(self) -> None:
+        """Build a real workbook with only the header and summary when there are no records."""
+        excel_data = _create_excel_export([], calculate_statistics([]))
+
+        ws = load_workbook(io.BytesIO(excel_data))["Validations"]
+        rows = [[cell.value for cell in row] for row in ws.iter_rows()]
+        assert rows[0][0] == "ID"
+        assert rows[2][0] == "RÉSUMÉ"
+        assert rows[3][:2] == ["Total commandes", 0]
+
+
+class TestFilteredIndices:
+    """Tests for _filtered_indices function."""
+
+    def _create_record(
+        self, record_id: int, operator: str, source: OrderSource
+    ) -> ValidationRecord:
+        """Create a complete ValidationRecord."""
+        order = Order(
+            order_id=f"ORD-{record_id}",
+            source=source,
+            items=[OrderItem(item=Item.GYOZA, quantity=1)],
+        )
+        return ValidationRecord(
+            id=record_id,
+            order_id=f"ORD-{record_id}",
+            timestamp=datetime(2024, 1, 15, 12, record_id, 0),
+            operator=operator,
+            is_complete=True,
+            expected_order=order,
+            detected_order=order,
+            comparison_result=ComparisonResult(
+                is_complete=True,
+                missing_items=[],
+                too_few_items=[],
+                too_many_items=[],
+                extra_items=[],
+                matched_items=[],
+            ),
+        )
+
+    def test_filtered_indices_by_operator_and_source(self) -> None:
+        """Return positions of records matching every active filter."""
+        records = [
+            self._create_record(1, "Alice", OrderSource.UBER_EATS),
+            self._create_record(2, "Bob", OrderSource.UBER_EATS),
+            self._create_record(3, "Alice", OrderSource.DELIVEROO),
+        ]
+
+        assert _filtered_indices(records, ((), (), ())) == [0, 1, 2]
+        assert _filtered_indices(records, (("Alice",), (), ())) == [0, 2]
+        assert _filtered_indices(records, (("Alice",), ("deliveroo",), ())) == [2]
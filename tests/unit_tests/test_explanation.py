@@ -1,9 +1,11 @@
 """Tests for validation explanation service."""
 
+from collections.abc import AsyncIterator
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from celeste.exceptions import StreamingNotSupportedError
 
 from staff_meal.models import (
     ComparisonResult,
@@ -19,9 +21,10 @@ from staff_meal.models import (
 )
 from ui.services.explanation import (
     generate_dashboard_insights,
-    generate_dashboard_insights_sync,
     generate_validation_explanation,
     generate_validation_explanation_async,
+    stream_dashboard_insights,
+    stream_dashboard_insights_sync,
 )
 
 
@@ -51,7 +54,7 @@ class TestGenerateValidationExplanationAsync:
         mock_client = MagicMock()
         mock_client.generate = AsyncMock(return_value=mock_output)
 
-        with patch("ui.services.explanation.create_client", return_value=mock_client):
+        with patch("ui.services.client_config.create_client", return_value=mock_client):
             result = await generate_validation_explanation_async(
                 expected_order, detected_order, Language.FRENCH
             )
@@ -61,6 +64,30 @@ class TestGenerateValidationExplanationAsync:
         call_args = mock_client.generate.call_args[1]
         assert "Generate the answer in French" in call_args["prompt"]
 
+    @pytest.mark.asyncio
+    async def test_generate_explanation_reuses_client(self) -> None:
+        """generate_validation_explanation_async creates the client once per provider, model and key."""
+        order = Order(
+            order_id="ORD-123",
+            source=OrderSource.UBER_EATS,
+            items=[OrderItem(item=Item.GYOZA, quantity=2)],
+        )
+
+        mock_output = MagicMock()
+        mock_output.content = "La commande est complète."
+
+        mock_client = MagicMock()
+        mock_client.generate = AsyncMock(return_value=mock_output)
+
+        with patch(
+            "ui.services.client_config.create_client", return_value=mock_client
+        ) as mock_create:
+            await generate_validation_explanation_async(order, order, Language.FRENCH)
+            await generate_validation_explanation_async(order, order, Language.ENGLISH)
+
+        mock_create.assert_called_once()
+        assert mock_client.generate.await_count == 2
+
     @pytest.mark.asyncio
     async def test_generate_explanation_missing_items(self) -> None:
         """Generate explanation for order with missing items."""
@@ -85,7 +112,7 @@ class TestGenerateValidationExplanationAsync:
         mock_client = MagicMock()
         mock_client.generate = AsyncMock(return_value=mock_output)
 
-        with patch("ui.services.explanation.create_client", return_value=mock_client):
+        with patch("ui.services.client_config.create_client", return_value=mock_client):
             result = await generate_validation_explanation_async(
                 expected_order, detected_order, Language.FRENCH
             )
@@ -116,7 +143,7 @@ class TestGenerateValidationExplanationAsync:
         mock_client = MagicMock()
         mock_client.generate = AsyncMock(return_value=mock_output)
 
-        with patch("ui.services.explanation.create_client", return_value=mock_client):
+        with patch("ui.services.client_config.create_client", return_value=mock_client):
             result = await generate_validation_explanation_async(
                 expected_order, detected_order
             )
@@ -150,7 +177,7 @@ class TestGenerateValidationExplanationAsync:
         mock_client = MagicMock()
         mock_client.generate = AsyncMock(return_value=mock_output)
 
-        with patch("ui.services.explanation.create_client", return_value=mock_client):
+        with patch("ui.services.client_config.create_client", return_value=mock_client):
             result = await generate_validation_explanation_async(
                 expected_order, detected_order, Language.FRENCH
             )
@@ -179,7 +206,7 @@ class TestGenerateValidationExplanationAsync:
         mock_client = MagicMock()
         mock_client.generate = AsyncMock(return_value=mock_output)
 
-        with patch("ui.services.explanation.create_client", return_value=mock_client):
+        with patch("ui.services.client_config.create_client", return_value=mock_client):
             result = await generate_validation_explanation_async(
                 expected_order, detected_order, Language.ENGLISH
             )
@@ -212,7 +239,7 @@ class TestGenerateValidationExplanationAsync:
         mock_client = MagicMock()
         mock_client.generate = AsyncMock(return_value=mock_output)
 
-        with patch("ui.services.explanation.create_client", return_value=mock_client):
+        with patch("ui.services.client_config.create_client", return_value=mock_client):
             result = await generate_validation_explanation_async(
                 expected_order, detected_order, Language.SPANISH
             )
@@ -243,7 +270,7 @@ class TestGenerateValidationExplanationAsync:
         mock_client = MagicMock()
         mock_client.generate = AsyncMock(return_value=mock_output)
 
-        with patch("ui.services.explanation.create_client", return_value=mock_client):
+        with patch("ui.services.client_config.create_client", return_value=mock_client):
             result = await generate_validation_explanation_async(
                 expected_order, detected_order
             )
@@ -275,7 +302,7 @@ class TestGenerateValidationExplanationAsync:
         mock_client.generate = AsyncMock(return_value=mock_output)
 
         with (
-            patch("ui.services.explanation.create_client", return_value=mock_client),
+            patch("ui.services.client_config.create_client", return_value=mock_client),
             pytest.raises(ValueError, match="Failed to generate explanation"),
         ):
             await generate_validation_explanation_async(
@@ -304,7 +331,7 @@ class TestGenerateValidationExplanationAsync:
         mock_client = MagicMock()
         mock_client.generate = AsyncMock(return_value=mock_output)
 
-        with patch("ui.services.explanation.create_client", return_value=mock_client):
+        with patch("ui.services.client_config.create_client", return_value=mock_client):
             result = await generate_validation_explanation_async(
                 expected_order, detected_order, Language.FRENCH
             )
@@ -336,7 +363,7 @@ class TestGenerateValidationExplanation:
         mock_client.generate = AsyncMock(return_value=mock_output)
 
         with (
-            patch("ui.services.explanation.create_client", return_value=mock_client),
+            patch("ui.services.client_config.create_client", return_value=mock_client),
             patch("ui.utils.runner") as mock_runner,
         ):
             mock_runner.run.return_value = "La commande est complète."
@@ -433,7 +460,7 @@ class TestGenerateDashboardInsights:
         mock_client = MagicMock()
         mock_client.generate = AsyncMock(return_value=mock_output)
 
-        with patch("ui.services.explanation.create_client", return_value=mock_client):
+        with patch("ui.services.client_config.create_client", return_value=mock_client):
             result = await generate_dashboard_insights(stats, records)
 
         assert len(result) > 0
@@ -477,7 +504,7 @@ class TestGenerateDashboardInsights:
         mock_client.generate = AsyncMock(return_value=mock_output)
 
         with (
-            patch("ui.services.explanation.create_client", return_value=mock_client),
+            patch("ui.services.client_config.create_client", return_value=mock_client),
             pytest.raises(ValueError, match="Failed to generate dashboard insights"),
         ):
             await generate_dashboard_insights(stats, records)
@@ -521,7 +548,7 @@ class TestGenerateDashboardInsights:
         mock_client = MagicMock()
         mock_client.generate = AsyncMock(return_value=mock_output)
 
-        with patch("ui.services.explanation.create_client", return_value=mock_client):
+        with patch("ui.services.client_config.create_client", return_value=mock_client):
             result = await generate_dashboard_insights(stats, records)
 
         assert len(result) > 0
@@ -529,12 +556,72 @@ class TestGenerateDashboardInsights:
         prompt_text = call_args["prompt"]
         assert "erreurs" in prompt_text.lower() or "errors" in prompt_text.lower()
 
+    @pytest.mark.asyncio
+    async def test_stream_dashboard_insights_yields_chunks(self) -> None:
+        """Stream dashboard insights yields the model's text chunks in order."""
+        records = [self._create_mock_record("ORD-1", is_complete=True)]
 
-class TestGenerateDashboardInsightsSync:
-    """Tests for generate_dashboard_insights_sync wrapper."""
+        stats = Statistics(
+            total_orders=1,
+            complete_orders=1,
+            error_rate=0.0,
+            most_forgotten_items=[],
+            errors_by_hour={},
+            errors_by_day={},
+        )
 
-    def test_generate_dashboard_insights_sync_wrapper(self) -> None:
-        """Sync wrapper calls async function correctly."""
+        async def chunks() -> AsyncIterator[MagicMock]:
+            for text in ("🟢 OK: ", "", "rien à signaler"):
+                yield MagicMock(content=text)
+
+        mock_client = MagicMock()
+        mock_client.stream.return_value = chunks()
+
+        with patch("ui.services.client_config.create_client", return_value=mock_client):
+            result = [
+                piece async for piece in stream_dashboard_insights(stats, records)
+            ]
+
+        assert result == ["🟢 OK: ", "rien à signaler"]
+        mock_client.stream.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stream_dashboard_insights_falls_back_without_streaming(self) -> None:
+        """Stream dashboard insights yields the full text when the model cannot stream."""
+        records = [self._create_mock_record("ORD-1", is_complete=True)]
+
+        stats = Statistics(
+            total_orders=1,
+            complete_orders=1,
+            error_rate=0.0,
+            most_forgotten_items=[],
+            errors_by_hour={},
+            errors_by_day={},
+        )
+
+        mock_output = MagicMock()
+        mock_output.content = "Recommandations générées."
+
+        mock_client = MagicMock()
+        mock_client.stream.side_effect = StreamingNotSupportedError(
+            model_id="test-model"
+        )
+        mock_client.generate = AsyncMock(return_value=mock_output)
+
+        with patch("ui.services.client_config.create_client", return_value=mock_client):
+            result = [
+                piece async for piece in stream_dashboard_insights(stats, records)
+            ]
+
+        assert result == ["Recommandations générées."]
+        mock_client.generate.assert_called_once()
+
+
+class TestStreamDashboardInsightsSync:
+    """Tests for stream_dashboard_insights_sync wrapper."""
+
+    def test_stream_dashboard_insights_sync_wrapper(self) -> None:
+        """Sync wrapper drains the async generator through the runner."""
         records = [
             ValidationRecord(
                 id=1,
@@ -573,8 +660,8 @@ class TestGenerateDashboardInsightsSync:
         )
 
         with patch("ui.utils.runner") as mock_runner:
-            mock_runner.run.return_value = "Recommandations générées."
-            result = generate_dashboard_insights_sync(stats, records)
+            mock_runner.iterate.return_value = iter(["Recommandations ", "générées."])
+            result = list(stream_dashboard_insights_sync(stats, records))
 
-        assert result == "Recommandations générées."
-        mock_runner.run.assert_called_once()
+        assert result == ["Recommandations ", "générées."]
+        mock_runner.iterate.assert_called_once()
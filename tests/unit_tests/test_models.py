@@ -1,9 +1,19 @@
 """Tests for domain models."""
 
+from datetime import datetime
+
 import pytest
 from pydantic import ValidationError
 
-from staff_meal.models import Item, Order, OrderItem, OrderSource
+from staff_meal.models import (
+    ComparisonResult,
+    Item,
+    ItemMismatch,
+    Order,
+    OrderItem,
+    OrderSource,
+    ValidationRecord,
+)
 
 
 class TestOrderItem:
@@ -85,6 +95,22 @@ class TestOrder:
         )
         assert order.total_items() == 6
 
+    def test_order_items_by_name(self) -> None:
+        """Order.items_by_name maps item names to quantities and follows updated copies."""
+        order = Order(
+            order_id="ORD-123",
+            source=OrderSource.DELIVEROO,
+            items=[
+                OrderItem(item=Item.GYOZA, quantity=2),
+                OrderItem(item=Item.SAUCE, quantity=1),
+            ],
+        )
+        assert order.items_by_name() == {Item.GYOZA.value: 2, Item.SAUCE.value: 1}
+        updated = order.model_copy(
+            update={"items": [OrderItem(item=Item.RAMEN, quantity=1)]}
+        )
+        assert updated.items_by_name() == {Item.RAMEN.value: 1}
+
     def test_order_items_must_not_be_empty(self) -> None:
         """Order validation: items list must have at least one item."""
         with pytest.raises(ValidationError) as exc_info:
@@ -131,3 +157,80 @@ class TestOrder:
             Order(**kwargs)
         errors = exc_info.value.errors()
         assert any(error["loc"] == (missing_field,) for error in errors)
+
+
+class TestValidationRecord:
+    """Tests for ValidationRecord derived summaries."""
+
+    def _make_record(self) -> ValidationRecord:
+        expected = Order(
+            order_id="ORD-123",
+            source=OrderSource.UBER_EATS,
+            items=[
+                OrderItem(item=Item.GYOZA, quantity=2),
+                OrderItem(item=Item.SAUCE, quantity=1),
+                OrderItem(item=Item.RAMEN, quantity=1),
+            ],
+        )
+        detected = Order(
+            order_id="ORD-123",
+            source=OrderSource.UBER_EATS,
+            items=[
+                OrderItem(item=Item.GYOZA, quantity=1),
+                OrderItem(item=Item.RAMEN, quantity=1),
+                OrderItem(item=Item.MOCHI, quantity=1),
+            ],
+        )
+        return ValidationRecord(
+            id=1,
+            order_id="ORD-123",
+            timestamp=datetime(2024, 1, 15, 12, 30),
+            is_complete=False,
+            expected_order=expected,
+            detected_order=detected,
+            comparison_result=ComparisonResult(
+                is_complete=False,
+                missing_items=[
+                    ItemMismatch(
+                        item=Item.SAUCE, expected_quantity=1, detected_quantity=0
+                    )
+                ],
+                too_few_items=[
+                    ItemMismatch(
+                        item=Item.GYOZA, expected_quantity=2, detected_quantity=1
+                    )
+                ],
+                extra_items=[OrderItem(item=Item.MOCHI, quantity=1)],
+            ),
+        )
+
+    def test_item_summaries(self) -> None:
+        """Summaries join items in the export format."""
+        record = self._make_record()
+        assert record.expected_items_summary() == (
+            "2x Boite de 4 Gyoza, 1x Sauce, 1x Ramen"
+        )
+        assert record.detected_items_summary() == (
+            "1x Boite de 4 Gyoza, 1x Ramen, 1x Boite de 2 Mochi"
+        )
+        assert record.missing_items_summary() == "1x Sauce"
+        assert record.too_few_items_summary() == "2x Boite de 4 Gyoza"
+        assert record.too_many_items_summary() == ""
+        assert record.extra_items_summary() == "1x Boite de 2 Mochi"
+        assert record.error_count() == 3
+
+    def test_summaries_follow_copies(self) -> None:
+        """Summaries reflect the record they are called on, including updated copies."""
+        record = self._make_record()
+        assert record.expected_items_summary() != ""
+        updated = record.model_copy(
+            update={
+                "expected_order": Order(
+                    order_id="ORD-123",
+                    source=OrderSource.UBER_EATS,
+                    items=[OrderItem(item=Item.SAUCE, quantity=3)],
+                )
+            }
+        )
+        assert updated.expected_items_summary() == "3x Sauce"
+        assert record.expected_items_summary() != updated.expected_items_summary()
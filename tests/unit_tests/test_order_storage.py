@@ -1,5 +1,6 @@
 """Tests for order storage service."""
 
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -144,6 +145,36 @@ class TestGetAllOrders:
         mock_order.limit.assert_called_once_with(5)
         assert len(result) == 1
 
+    @pytest.mark.asyncio
+    async def test_get_all_orders_with_before_cursor(self) -> None:
+        """get_all_orders filters on created_at below the cursor before ordering."""
+        mock_response = MagicMock()
+        mock_response.data = []
+
+        mock_limit = MagicMock()
+        mock_limit.execute.return_value = mock_response
+        mock_order = MagicMock()
+        mock_order.limit.return_value = mock_limit
+        mock_lt = MagicMock()
+        mock_lt.order.return_value = mock_order
+        mock_select = MagicMock()
+        mock_select.lt.return_value = mock_lt
+        mock_table = MagicMock()
+        mock_table.select.return_value = mock_select
+
+        mock_client = MagicMock()
+        mock_client.table.return_value = mock_table
+
+        before = datetime(2025, 1, 15, 12, 0, 0)
+        with patch(
+            "staff_meal.order_storage.get_supabase_client", return_value=mock_client
+        ):
+            await get_all_orders(limit=50, before=before)
+
+        mock_select.lt.assert_called_once_with("created_at", before.isoformat())
+        mock_lt.order.assert_called_once_with("created_at", desc=True)
+        mock_order.limit.assert_called_once_with(50)
+
     @pytest.mark.asyncio
     async def test_get_all_orders_empty_result(self) -> None:
         """get_all_orders handles empty results from Supabase."""
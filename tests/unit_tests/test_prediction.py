@@ -37,7 +37,7 @@ class TestPredictOrderAsync:
         mock_client = MagicMock()
         mock_client.generate = AsyncMock(return_value=mock_output)
 
-        with patch("ui.services.prediction.create_client", return_value=mock_client):
+        with patch("ui.services.client_config.create_client", return_value=mock_client):
             result = await predict_order_async(bag_image, expected_order=expected_order)
 
         assert result.order_id == expected_order.order_id
@@ -67,13 +67,37 @@ class TestPredictOrderAsync:
         mock_client = MagicMock()
         mock_client.generate = AsyncMock(return_value=mock_output)
 
-        with patch("ui.services.prediction.create_client", return_value=mock_client):
+        with patch("ui.services.client_config.create_client", return_value=mock_client):
             result = await predict_order_async(bag_image)
 
         assert result.order_id == detected_order.order_id
         assert result.source == detected_order.source
         assert len(result.items) == 1
 
+    @pytest.mark.asyncio
+    async def test_predict_order_async_reuses_client(self) -> None:
+        """predict_order_async creates the client once per provider, model and key."""
+        bag_image = Image.new("RGB", (100, 100), color="white")
+
+        mock_output = MagicMock()
+        mock_output.content = Order(
+            order_id="ORD-456",
+            source=OrderSource.DELIVEROO,
+            items=[OrderItem(item=Item.MAKI_CALIFORNIA, quantity=1)],
+        )
+
+        mock_client = MagicMock()
+        mock_client.generate = AsyncMock(return_value=mock_output)
+
+        with patch(
+            "ui.services.client_config.create_client", return_value=mock_client
+        ) as mock_create:
+            await predict_order_async(bag_image)
+            await predict_order_async(bag_image)
+
+        mock_create.assert_called_once()
+        assert mock_client.generate.await_count == 2
+
     @pytest.mark.asyncio
     async def test_predict_order_async_filters_zero_quantities(self) -> None:
         """predict_order_async filters out items with quantity <= 0."""
@@ -95,7 +119,7 @@ class TestPredictOrderAsync:
         mock_client = MagicMock()
         mock_client.generate = AsyncMock(return_value=mock_output)
 
-        with patch("ui.services.prediction.create_client", return_value=mock_client):
+        with patch("ui.services.client_config.create_client", return_value=mock_client):
             result = await predict_order_async(bag_image)
 
         assert len(result.items) == 1
@@ -122,7 +146,7 @@ class TestPredictOrderAsync:
         mock_client.generate = AsyncMock(return_value=mock_output)
 
         with (
-            patch("ui.services.prediction.create_client", return_value=mock_client),
+            patch("ui.services.client_config.create_client", return_value=mock_client),
             pytest.raises(ValueError, match="No valid items detected"),
         ):
             await predict_order_async(bag_image)
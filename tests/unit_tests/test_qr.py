@@ -2,11 +2,14 @@
 
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+import zxingcpp
+from PIL import Image
 
 from staff_meal.models import Item, Order, OrderItem, OrderSource
-from staff_meal.qr import decode_qr, generate_qr
+from staff_meal.qr import _otsu_threshold, decode_qr, generate_qr
 
 
 class TestGenerateQR:
@@ -82,6 +85,20 @@ class TestDecodeQR:
 
         Path(qr_path).unlink()
 
+    def test_decode_qr_from_pil_image(self) -> None:
+        """decode_qr decodes an in-memory PIL Image without a file."""
+        order = Order(
+            order_id="TEST-MEM",
+            source=OrderSource.UBER_EATS,
+            items=[OrderItem(item=Item.SAUCE, quantity=2)],
+        )
+
+        decoded_order = decode_qr(generate_qr(order).convert("RGB"))
+
+        assert decoded_order.order_id == order.order_id
+        assert decoded_order.items[0].item == Item.SAUCE
+        assert decoded_order.items[0].quantity == 2
+
     def test_decode_qr_no_qr_code(self) -> None:
         """decode_qr raises ValueError for image without QR code."""
         from PIL import Image
@@ -96,3 +113,45 @@ class TestDecodeQR:
             decode_qr(no_qr_path)
 
         Path(no_qr_path).unlink()
+
+    def test_decode_qr_retries_preprocessed_variants(self) -> None:
+        """decode_qr falls back to preprocessed variants when the raw decode fails."""
+        order = Order(
+            order_id="TEST-LOW",
+            source=OrderSource.DELIVEROO,
+            items=[OrderItem(item=Item.GYOZA, quantity=3)],
+        )
+        gray = generate_qr(order).convert("L")
+        low_contrast = gray.point(lambda value: 150 if value > 127 else 110)
+
+        read_barcodes = zxingcpp.read_barcodes
+        calls: list[Image.Image] = []
+
+        def fail_raw_decode(image: Image.Image) -> list[zxingcpp.Barcode]:
+            calls.append(image)
+            return [] if len(calls) == 1 else read_barcodes(image)
+
+        with patch("staff_meal.qr.zxingcpp.read_barcodes", side_effect=fail_raw_decode):
+            decoded_order = decode_qr(low_contrast)
+
+        assert decoded_order == order
+        assert len(calls) >= 2
+        assert calls[0] is low_contrast
+
+
+class TestOtsuThreshold:
+    """Tests for the Otsu binarization threshold."""
+
+    def test_otsu_threshold_splits_bimodal_histogram(self) -> None:
+        """_otsu_threshold separates two gray-level peaks."""
+        histogram = [0] * 256
+        histogram[40] = 500
+        histogram[200] = 500
+        threshold = _otsu_threshold(histogram)
+        assert 40 <= threshold < 200
+
+    def test_otsu_threshold_uniform_image(self) -> None:
+        """_otsu_threshold returns 0 for a single gray level."""
+        histogram = [0] * 256
+        histogram[255] = 1000
+        assert _otsu_threshold(histogram) == 0
@@ -3,18 +3,26 @@
 import csv
 import io
 import re
+from collections.abc import Iterator
+from concurrent.futures import Future
 from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd  # type: ignore[import-untyped]
-import plotly.express as px  # type: ignore[import-untyped]
-import plotly.graph_objects as go  # type: ignore[import-untyped]
 import streamlit as st
 
 try:
     from openpyxl import Workbook  # type: ignore[import-untyped]
+    from openpyxl.cell import WriteOnlyCell  # type: ignore[import-untyped]
     from openpyxl.styles import Font, PatternFill, Alignment  # type: ignore[import-untyped]
     from openpyxl.utils.dataframe import dataframe_to_rows  # type: ignore[import-untyped]
     HAS_EXCEL = True
+
+    # Shared header styles, built once rather than on every export
+    _HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    _HEADER_FONT = Font(bold=True, color="FFFFFF")
+    _HEADER_ALIGN = Alignment(horizontal="center", vertical="center")
+    _SUMMARY_FONT = Font(bold=True)
 except ImportError:
     HAS_EXCEL = False
 
@@ -23,7 +31,7 @@ from celeste.exceptions import MissingCredentialsError
 from staff_meal.models import OrderSource, Statistics, ValidationRecord
 from staff_meal.storage import get_all_validation_records
 from ui.services.alerts import Alert, detect_alerts
-from ui.services.explanation import generate_dashboard_insights_sync
+from ui.services.explanation import stream_dashboard_insights_sync
 from ui.services.statistics import (
     calculate_statistics,
     get_statistics_by_operator,
@@ -31,7 +39,113 @@ from ui.services.statistics import (
 )
 from ui.utils import runner
 
+# Above this many points, scatter traces switch to WebGL rendering instead of SVG
+_WEBGL_POINT_THRESHOLD = 1000
+# Longer trend series are downsampled with LTTB to keep the client render bounded
+_TREND_MAX_POINTS = 2000
+# Rate columns stay numeric in the comparison tables and are formatted client-side
+_RATE_COLUMN_CONFIG = {
+    "Taux de complétude (%)": st.column_config.NumberColumn(format="%.1f%%"),
+    "Taux d'erreur (%)": st.column_config.NumberColumn(format="%.1f%%"),
+}
+
+# Dashed 95% completion objective, equivalent to add_hline(y=95, annotation_position="right")
+_COMPLETION_TARGET_SHAPE = {
+    "type": "line",
+    "xref": "x domain",
+    "x0": 0,
+    "x1": 1,
+    "yref": "y",
+    "y0": 95,
+    "y1": 95,
+    "line": {"color": "orange", "dash": "dash"},
+}
+_COMPLETION_TARGET_ANNOTATION = {
+    "text": "Objectif: 95%",
+    "xref": "x domain",
+    "x": 1,
+    "xanchor": "left",
+    "yref": "y",
+    "y": 95,
+    "yanchor": "middle",
+    "showarrow": False,
+}
+
+
+def _record_cache_key(record: ValidationRecord) -> tuple[int | None, str, datetime]:
+    """Hash stored records by identity instead of pickling their full order payloads."""
+    return (record.id, record.order_id, record.timestamp)
+
+
+_RECORD_HASH_FUNCS = {ValidationRecord: _record_cache_key}
+
+# Indexed by datetime.weekday()
+_DAY_NAMES_EN = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_DAY_NAMES_FR = ("Lundi", "Mardi", "Mercredi", "Jeudi", "Vendredi", "Samedi", "Dimanche")
+_DAY_NAMES_EN_TO_FR = dict(zip(_DAY_NAMES_EN, _DAY_NAMES_FR, strict=True))
+
+# Error-type filter labels and the feature frame column counting each type, in display order
+_ERROR_TYPE_COLUMNS = {
+    "Articles manquants": "n_missing",
+    "Quantités insuffisantes": "n_too_few",
+    "Quantités excessives": "n_too_many",
+    "Articles supplémentaires": "n_extra",
+}
+_ERROR_COUNT_COLUMNS = tuple(_ERROR_TYPE_COLUMNS.values())
+
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+# A line opens a new recommendation when it starts with a severity emoji, a bullet,
+# a list number, or a severity/action keyword
+_NEW_REC_RE = re.compile(
+    r"^(?:[🔴🟡🟢⚠️📌💡]|[-•*]|\d+[\.)]"
+    r"|CRITIQUE|CRITICAL|URGENT|ATTENTION|WARNING|ALERTE|FOCUS|ACTION|RECOMMANDATION|SUGGESTION)",
+    re.IGNORECASE,
+)
+
+_PARSED_INSIGHTS_KEY = "dashboard_parsed_insights"
+
+_EXPORT_HEADERS = (
+    "ID",
+    "Order ID",
+    "Timestamp",
+    "Date",
+    "Heure",
+    "Jour",
+    "Operator",
+    "Source",
+    "Is Complete",
+    "Nombre erreurs",
+    "Expected Items",
+    "Detected Items",
+    "Missing Items",
+    "Too Few Items",
+    "Too Many Items",
+    "Extra Items",
+)
+
+
+def _prefetch_is_usable(future: Future[list[ValidationRecord]]) -> bool:
+    """Drop failed prefetches from the cache so the next rerun retries the fetch."""
+    return not future.done() or future.exception() is None
+
+
+@st.cache_resource(ttl=300, show_spinner=False, validate=_prefetch_is_usable)  # Cache for 5 minutes
+def _prefetch_records(start_dt: datetime | None, end_dt: datetime | None) -> Future[list[ValidationRecord]]:
+    """Start loading validation records in the background and share the pending fetch."""
+    return runner.submit(get_all_validation_records(start_date=start_dt, end_date=end_dt))
 
+
+@st.cache_data(ttl=300, show_spinner=False)  # Cache for 5 minutes
+def _load_prev_stats(prev_start_dt: datetime | None, prev_end_dt: datetime | None) -> Statistics | None:
+    """Load previous period statistics with caching."""
+    if not prev_start_dt or not prev_end_dt:
+        return None
+    # Reuses the fetch started alongside the current period in render_dashboard
+    prev_records = _prefetch_records(prev_start_dt, prev_end_dt).result()
+    return calculate_statistics(prev_records) if prev_records else None
+
+
+@st.fragment
 def render_dashboard() -> None:
     """Render statistics dashboard with metrics and charts."""
     st.markdown(
@@ -53,6 +167,21 @@ def render_dashboard() -> None:
             value=datetime.now().date(),
             key="dashboard_end_date",
         )
+
+    # Fire the fetch now so the DB round-trip overlaps with rendering the controls below
+    start_datetime = datetime.combine(start_date, datetime.min.time()) if start_date else None
+    end_datetime = datetime.combine(end_date, datetime.max.time()) if end_date else None
+    records_future = _prefetch_records(start_datetime, end_datetime)
+
+    # The previous period (same length, just before start) is fetched concurrently for the metric deltas
+    period_days = (end_date - start_date).days if end_date and start_date else 30
+    prev_start_datetime = None
+    prev_end_datetime = None
+    if start_date and period_days > 0:
+        prev_start_datetime = datetime.combine(start_date - timedelta(days=period_days), datetime.min.time())
+        prev_end_datetime = datetime.combine(start_date - timedelta(days=1), datetime.max.time())
+        _prefetch_records(prev_start_datetime, prev_end_datetime)
+
     with col3:
         st.markdown("<br>", unsafe_allow_html=True)
         if st.button("🔄 Actualiser", key="dashboard_refresh"):
@@ -60,24 +189,17 @@ def render_dashboard() -> None:
 
     st.divider()
 
+    with st.spinner("Chargement des données..."):
+        all_records = records_future.result()
+
     with st.expander("🔍 Filtres avancés", expanded=False):
         col1, col2, col3 = st.columns(3)
 
         with col1:
-            all_operators = set()
-            temp_records = runner.run(
-                get_all_validation_records(
-                    start_date=datetime.combine(start_date, datetime.min.time()) if start_date else None,
-                    end_date=datetime.combine(end_date, datetime.max.time()) if end_date else None,
-                )
-            )
-            for record in temp_records:
-                if record.operator:
-                    all_operators.add(record.operator)
-
+            all_operators = sorted({r.operator for r in all_records if r.operator})
             selected_operators = st.multiselect(
                 "Opérateur(s)",
-                options=sorted(all_operators) if all_operators else [],
+                options=all_operators,
                 key="dashboard_filter_operators",
             )
 
@@ -97,17 +219,6 @@ def render_dashboard() -> None:
 
     st.divider()
 
-    @st.cache_data(ttl=300)  # Cache for 5 minutes
-    def _load_records(start_dt: datetime | None, end_dt: datetime | None) -> list[ValidationRecord]:
-        """Load validation records with caching."""
-        result = runner.run(get_all_validation_records(start_date=start_dt, end_date=end_dt))
-        return result  # type: ignore[no-any-return]
-
-    with st.spinner("Chargement des données..."):
-        start_datetime = datetime.combine(start_date, datetime.min.time()) if start_date else None
-        end_datetime = datetime.combine(end_date, datetime.max.time()) if end_date else None
-        all_records = _load_records(start_datetime, end_datetime)
-
     if not all_records:
         st.info("Aucune donnée disponible pour la période sélectionnée.")
         return
@@ -150,25 +261,7 @@ def render_dashboard() -> None:
 
     st.markdown("#### 📈 Métriques principales")
 
-    @st.cache_data(ttl=300)
-    def _load_prev_stats(prev_start_dt: datetime | None, prev_end_dt: datetime | None) -> Statistics | None:
-        """Load previous period statistics with caching."""
-        if not prev_start_dt or not prev_end_dt:
-            return None
-        prev_records = runner.run(
-            get_all_validation_records(start_date=prev_start_dt, end_date=prev_end_dt)
-        )
-        return calculate_statistics(prev_records) if prev_records else None
-
-    period_days = (end_date - start_date).days if end_date and start_date else 30
-    prev_start_date = start_date - timedelta(days=period_days) if start_date else None
-    prev_end_date = start_date - timedelta(days=1) if start_date else None
-
-    prev_stats = None
-    if prev_start_date and prev_end_date:
-        prev_start_datetime = datetime.combine(prev_start_date, datetime.min.time())
-        prev_end_datetime = datetime.combine(prev_end_date, datetime.max.time())
-        prev_stats = _load_prev_stats(prev_start_datetime, prev_end_datetime)
+    prev_stats = _load_prev_stats(prev_start_datetime, prev_end_datetime)
 
     col1, col2, col3, col4 = st.columns(4)
 
@@ -204,31 +297,7 @@ def render_dashboard() -> None:
 
     st.divider()
 
-    st.markdown("#### 💡 Recommandations IA")
-    insights_key = "dashboard_ai_insights"
-    if insights_key not in st.session_state:
-        st.session_state[insights_key] = None
-
-    col1, col2 = st.columns([3, 1])
-    with col1:
-        if st.session_state[insights_key]:
-            _render_formatted_insights(st.session_state[insights_key])
-        else:
-            st.info("💡 Cliquez sur le bouton pour générer des recommandations basées sur vos données.")
-    with col2:
-        if st.button("✨ Générer", key="dashboard_generate_insights", type="primary"):
-            with st.spinner("Analyse en cours..."):
-                try:
-                    insights = generate_dashboard_insights_sync(stats, records)
-                except MissingCredentialsError:
-                    st.warning(
-                        "⚠️ **API Key manquante** : Veuillez configurer la clé API pour Text Generation "
-                        "dans la barre latérale (section ⚙️ Celeste AI config) ou définir la variable "
-                        "d'environnement pour le fournisseur."
-                    )
-                    insights = "Configuration de l'API requise pour générer les recommandations."
-                st.session_state[insights_key] = insights
-                st.rerun()
+    _render_ai_insights(stats, records)
 
     st.divider()
 
@@ -279,79 +348,86 @@ def render_dashboard() -> None:
         )
 
 
-def _create_csv_export(records: list[ValidationRecord], stats: Statistics) -> str:
-    """Create CSV export of validation records with calculated fields."""
-    output = io.StringIO()
-    writer = csv.writer(output)
+@st.fragment
+def _render_ai_insights(stats: Statistics, records: list[ValidationRecord]) -> None:
+    """Render the AI recommendations section.
 
-    writer.writerow(
-        [
-            "ID",
-            "Order ID",
-            "Timestamp",
-            "Date",
-            "Heure",
-            "Jour",
-            "Operator",
-            "Source",
-            "Is Complete",
-            "Nombre erreurs",
-            "Expected Items",
-            "Detected Items",
-            "Missing Items",
-            "Too Few Items",
-            "Too Many Items",
-            "Extra Items",
-        ]
-    )
+    Runs as a fragment so generating insights only reruns this section,
+    not the charts and exports around it.
+    """
+    st.markdown("#### 💡 Recommandations IA")
+    insights_key = "dashboard_ai_insights"
+    if insights_key not in st.session_state:
+        st.session_state[insights_key] = None
 
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        insights_slot = st.empty()
+        if st.session_state[insights_key]:
+            with insights_slot.container():
+                _render_formatted_insights(st.session_state[insights_key])
+        else:
+            insights_slot.info("💡 Cliquez sur le bouton pour générer des recommandations basées sur vos données.")
+    with col2:
+        generate_clicked = st.button("✨ Générer", key="dashboard_generate_insights", type="primary")
+
+    if generate_clicked:
+        # Show the text as it streams in, then rerun to render it as formatted cards
+        try:
+            with insights_slot.container():
+                insights = st.write_stream(stream_dashboard_insights_sync(stats, records))
+        except MissingCredentialsError:
+            st.warning(
+                "⚠️ **API Key manquante** : Veuillez configurer la clé API pour Text Generation "
+                "dans la barre latérale (section ⚙️ Celeste AI config) ou définir la variable "
+                "d'environnement pour le fournisseur."
+            )
+            insights = "Configuration de l'API requise pour générer les recommandations."
+        st.session_state[insights_key] = str(insights).strip()
+        st.rerun(scope="fragment")
+
+
+def _iter_rows(records: list[ValidationRecord]) -> Iterator[list[str]]:
+    """Yield one export row per record, in _EXPORT_HEADERS column order.
+
+    Args:
+        records: List of validation records.
+
+    Yields:
+        Row of formatted cell values.
+    """
     for record in records:
-        expected_items_str = ", ".join([f"{item.quantity}x {item.item.value}" for item in record.expected_order.items])
-        detected_items_str = ", ".join([f"{item.quantity}x {item.item.value}" for item in record.detected_order.items])
-        missing_items_str = ", ".join(
-            [f"{m.expected_quantity}x {m.item.value}" for m in record.comparison_result.missing_items]
-        )
-        too_few_str = ", ".join(
-            [f"{m.expected_quantity}x {m.item.value}" for m in record.comparison_result.too_few_items]
-        )
-        too_many_str = ", ".join(
-            [f"{m.expected_quantity}x {m.item.value}" for m in record.comparison_result.too_many_items]
-        )
-        extra_items_str = ", ".join(
-            [f"{item.quantity}x {item.item.value}" for item in record.comparison_result.extra_items]
-        )
+        ts = record.timestamp
+        yield [
+            str(record.id) if record.id else "",
+            record.order_id,
+            ts.isoformat(),
+            ts.date().isoformat(),
+            f"{ts.hour:02d}:{ts.minute:02d}",
+            _DAY_NAMES_FR[ts.weekday()],
+            record.operator or "",
+            record.expected_order.source.value,
+            "Oui" if record.is_complete else "Non",
+            str(record.error_count()),
+            record.expected_items_summary(),
+            record.detected_items_summary(),
+            record.missing_items_summary(),
+            record.too_few_items_summary(),
+            record.too_many_items_summary(),
+            record.extra_items_summary(),
+        ]
 
-        error_count = (
-            len(record.comparison_result.missing_items)
-            + len(record.comparison_result.too_few_items)
-            + len(record.comparison_result.too_many_items)
-            + len(record.comparison_result.extra_items)
-        )
 
-        day_names = ["Lundi", "Mardi", "Mercredi", "Jeudi", "Vendredi", "Samedi", "Dimanche"]
-        day_name = day_names[record.timestamp.weekday()]
-
-        writer.writerow(
-            [
-                record.id or "",
-                record.order_id,
-                record.timestamp.isoformat(),
-                record.timestamp.date().isoformat(),
-                f"{record.timestamp.hour:02d}:{record.timestamp.minute:02d}",
-                day_name,
-                record.operator or "",
-                record.expected_order.source.value,
-                "Oui" if record.is_complete else "Non",
-                error_count,
-                expected_items_str,
-                detected_items_str,
-                missing_items_str,
-                too_few_str,
-                too_many_str,
-                extra_items_str,
-            ]
-        )
+@st.cache_data(ttl=300, show_spinner=False, hash_funcs=_RECORD_HASH_FUNCS)
+def _create_csv_export(records: list[ValidationRecord], stats: Statistics) -> str:
+    """Create CSV export of validation records with calculated fields."""
+    df = pd.DataFrame(_iter_rows(records), columns=list(_EXPORT_HEADERS))
+
+    output = io.StringIO()
+    # Same "\r\n" terminator as csv.writer so the summary block below matches the table
+    df.to_csv(output, index=False, lineterminator="\r\n")
 
+    writer = csv.writer(output)
     writer.writerow([])
     writer.writerow(["RÉSUMÉ"])
     writer.writerow(["Total commandes", stats.total_orders])
@@ -362,6 +438,7 @@ def _create_csv_export(records: list[ValidationRecord], stats: Statistics) -> st
     return output.getvalue()
 
 
+@st.cache_data(ttl=300, show_spinner=False, hash_funcs=_RECORD_HASH_FUNCS)
 def _create_excel_export(records: list[ValidationRecord], stats: Statistics) -> bytes:
     """Create Excel export of validation records."""
     if not HAS_EXCEL:
@@ -369,97 +446,31 @@ def _create_excel_export(records: list[ValidationRecord], stats: Statistics) ->
         csv_data = _create_csv_export(records, stats)
         return csv_data.encode("utf-8")
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Validations"
-
-    data_rows = []
-    headers = [
-        "ID",
-        "Order ID",
-        "Timestamp",
-        "Date",
-        "Heure",
-        "Jour",
-        "Operator",
-        "Source",
-        "Is Complete",
-        "Nombre erreurs",
-        "Expected Items",
-        "Detected Items",
-        "Missing Items",
-        "Too Few Items",
-        "Too Many Items",
-        "Extra Items",
-    ]
-    data_rows.append(headers)
-
-    for record in records:
-        expected_items_str = ", ".join([f"{item.quantity}x {item.item.value}" for item in record.expected_order.items])
-        detected_items_str = ", ".join([f"{item.quantity}x {item.item.value}" for item in record.detected_order.items])
-        missing_items_str = ", ".join(
-            [f"{m.expected_quantity}x {m.item.value}" for m in record.comparison_result.missing_items]
-        )
-        too_few_str = ", ".join(
-            [f"{m.expected_quantity}x {m.item.value}" for m in record.comparison_result.too_few_items]
-        )
-        too_many_str = ", ".join(
-            [f"{m.expected_quantity}x {m.item.value}" for m in record.comparison_result.too_many_items]
-        )
-        extra_items_str = ", ".join(
-            [f"{item.quantity}x {item.item.value}" for item in record.comparison_result.extra_items]
-        )
-
-        error_count = (
-            len(record.comparison_result.missing_items)
-            + len(record.comparison_result.too_few_items)
-            + len(record.comparison_result.too_many_items)
-            + len(record.comparison_result.extra_items)
-        )
+    # Write-only mode streams rows out instead of keeping a cell object per value
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Validations")
 
-        day_names = ["Lundi", "Mardi", "Mercredi", "Jeudi", "Vendredi", "Samedi", "Dimanche"]
-        day_name = day_names[record.timestamp.weekday()]
+    header_cells = []
+    for header in _EXPORT_HEADERS:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.fill = _HEADER_FILL
+        cell.font = _HEADER_FONT
+        cell.alignment = _HEADER_ALIGN
+        header_cells.append(cell)
+    ws.append(header_cells)
 
-        data_rows.append([
-            str(record.id) if record.id else "",
-            record.order_id,
-            record.timestamp.isoformat(),
-            record.timestamp.date().isoformat(),
-            f"{record.timestamp.hour:02d}:{record.timestamp.minute:02d}",
-            day_name,
-            record.operator or "",
-            record.expected_order.source.value,
-            "Oui" if record.is_complete else "Non",
-            str(error_count),
-            expected_items_str,
-            detected_items_str,
-            missing_items_str,
-            too_few_str,
-            too_many_str,
-            extra_items_str,
-        ])
-
-    for row in data_rows:
+    for row in _iter_rows(records):
         ws.append(row)
 
-    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF")
-    for cell in ws[1]:
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal="center", vertical="center")
-
-    summary_row = len(data_rows) + 2
-    ws.cell(row=summary_row, column=1, value="RÉSUMÉ").font = Font(bold=True)
-    ws.cell(row=summary_row + 1, column=1, value="Total commandes")
-    ws.cell(row=summary_row + 1, column=2, value=stats.total_orders)
-    ws.cell(row=summary_row + 2, column=1, value="Commandes complètes")
-    ws.cell(row=summary_row + 2, column=2, value=stats.complete_orders)
+    summary_title = WriteOnlyCell(ws, value="RÉSUMÉ")
+    summary_title.font = _SUMMARY_FONT
     completion_rate = (stats.complete_orders / stats.total_orders * 100) if stats.total_orders > 0 else 0.0
-    ws.cell(row=summary_row + 3, column=1, value="Taux de complétude")
-    ws.cell(row=summary_row + 3, column=2, value=f"{completion_rate:.1f}%")
-    ws.cell(row=summary_row + 4, column=1, value="Taux d'erreur")
-    ws.cell(row=summary_row + 4, column=2, value=f"{stats.error_rate:.1f}%")
+    ws.append([])
+    ws.append([summary_title])
+    ws.append(["Total commandes", stats.total_orders])
+    ws.append(["Commandes complètes", stats.complete_orders])
+    ws.append(["Taux de complétude", f"{completion_rate:.1f}%"])
+    ws.append(["Taux d'erreur", f"{stats.error_rate:.1f}%"])
 
     output = io.BytesIO()
     wb.save(output)
@@ -467,21 +478,21 @@ def _create_excel_export(records: list[ValidationRecord], stats: Statistics) ->
     return output.getvalue()
 
 
-def _render_formatted_insights(insights_text: str) -> None:
-    """Render AI insights in formatted cards with improved parsing."""
-    insights_text = re.sub(r"\n{3,}", "\n\n", insights_text.strip())
+def _parse_insights(insights_text: str) -> list[str]:
+    """Split AI insights text into individual recommendations.
+
+    Args:
+        insights_text: Raw insights text returned by the model.
+
+    Returns:
+        List of recommendation strings, in order.
+    """
+    insights_text = _BLANK_LINES_RE.sub("\n\n", insights_text.strip())
 
     lines = insights_text.split("\n")
     recommendations = []
     current_rec = ""
 
-    emoji_pattern = re.compile(r"^[🔴🟡🟢⚠️📌💡]")
-    bullet_pattern = re.compile(r"^[-•*]\s*")
-    number_pattern = re.compile(r"^\d+[\.)]\s*")
-    critical_pattern = re.compile(r"^(CRITIQUE|CRITICAL|URGENT|URGENTE)", re.IGNORECASE)
-    attention_pattern = re.compile(r"^(ATTENTION|WARNING|ALERTE|FOCUS)", re.IGNORECASE)
-    action_pattern = re.compile(r"^(ACTION|RECOMMANDATION|SUGGESTION)", re.IGNORECASE)
-
     for line in lines:
         line = line.strip()
         if not line:
@@ -490,16 +501,7 @@ def _render_formatted_insights(insights_text: str) -> None:
                 current_rec = ""
             continue
 
-        is_new_rec = (
-            emoji_pattern.match(line)
-            or bullet_pattern.match(line)
-            or number_pattern.match(line)
-            or critical_pattern.match(line)
-            or attention_pattern.match(line)
-            or action_pattern.match(line)
-        )
-
-        if is_new_rec:
+        if _NEW_REC_RE.match(line):
             if current_rec:
                 recommendations.append(current_rec.strip())
             current_rec = line
@@ -511,6 +513,20 @@ def _render_formatted_insights(insights_text: str) -> None:
     if current_rec:
         recommendations.append(current_rec.strip())
 
+    return recommendations
+
+
+def _render_formatted_insights(insights_text: str) -> None:
+    """Render AI insights in formatted cards with improved parsing."""
+    # Insights only change when regenerated, so parse once per text rather than on every rerun
+    text_hash = hash(insights_text)
+    cached = st.session_state.get(_PARSED_INSIGHTS_KEY)
+    if cached is not None and cached[0] == text_hash:
+        recommendations = cached[1]
+    else:
+        recommendations = _parse_insights(insights_text)
+        st.session_state[_PARSED_INSIGHTS_KEY] = (text_hash, recommendations)
+
     for rec in recommendations:
         if not rec or len(rec) < 5:  # Skip very short recommendations
             continue
@@ -531,89 +547,160 @@ def _render_formatted_insights(insights_text: str) -> None:
             st.markdown(f"📌 {rec}")
 
 
+@st.cache_data(ttl=300, show_spinner=False, hash_funcs=_RECORD_HASH_FUNCS)
+def _build_feature_frame(records: list[ValidationRecord]) -> pd.DataFrame:
+    """Flatten records into one row of chart features per record.
+
+    Built once per record set and shared by the tab renderers, so each chart
+    aggregates columns instead of walking the records again.
+
+    Args:
+        records: List of validation records.
+
+    Returns:
+        DataFrame with date (day-precision datetime64), weekday, hour,
+        is_complete, categorical operator and source columns, and int32
+        per-type error counts (n_missing, n_too_few, n_too_many, n_extra).
+    """
+    n = len(records)
+    timestamps = [r.timestamp for r in records]
+    comparisons = [r.comparison_result for r in records]
+    return pd.DataFrame(
+        {
+            "date": np.array([ts.date() for ts in timestamps], dtype="datetime64[D]"),
+            "weekday": np.fromiter((ts.weekday() for ts in timestamps), dtype=np.intp, count=n),
+            "hour": np.fromiter((ts.hour for ts in timestamps), dtype=np.intp, count=n),
+            "is_complete": np.fromiter((r.is_complete for r in records), dtype=bool, count=n),
+            "operator": pd.Categorical([r.operator for r in records]),
+            "source": pd.Categorical(
+                [r.expected_order.source.value for r in records],
+                categories=[source.value for source in OrderSource],
+            ),
+            "n_missing": np.fromiter((len(c.missing_items) for c in comparisons), dtype=np.int32, count=n),
+            "n_too_few": np.fromiter((len(c.too_few_items) for c in comparisons), dtype=np.int32, count=n),
+            "n_too_many": np.fromiter((len(c.too_many_items) for c in comparisons), dtype=np.int32, count=n),
+            "n_extra": np.fromiter((len(c.extra_items) for c in comparisons), dtype=np.int32, count=n),
+        }
+    )
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Select point indices with Largest-Triangle-Three-Buckets downsampling.
+
+    Args:
+        x: Numeric x values, sorted ascending.
+        y: Numeric y values aligned with x.
+        n_out: Number of points to keep (first and last are always kept).
+
+    Returns:
+        Sorted array of selected indices.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # n_out - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    prev = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        areas = np.abs(
+            (x[prev] - avg_x) * (y[start:end] - y[prev]) - (x[prev] - x[start:end]) * (avg_y - y[prev])
+        )
+        prev = start + int(areas.argmax())
+        indices[i + 1] = prev
+
+    return indices
+
+
 def _render_trend_charts(records: list[ValidationRecord], stats: Statistics) -> None:
     """Render trend analysis charts."""
+    import plotly.graph_objects as go  # type: ignore[import-untyped]
+
     if not records:
         st.info("Aucune donnée pour afficher les tendances.")
         return
 
-    records_by_date: dict[str, list[ValidationRecord]] = {}
-    for record in records:
-        date_key = record.timestamp.date().isoformat()
-        if date_key not in records_by_date:
-            records_by_date[date_key] = []
-        records_by_date[date_key].append(record)
-
-    dates = []
-    completion_rates = []
-    error_counts = []
-    for date_key in sorted(records_by_date.keys()):
-        daily_records = records_by_date[date_key]
-        daily_stats = calculate_statistics(daily_records)
-        dates.append(date_key)
-        completion_rate = (
-            (daily_stats.complete_orders / daily_stats.total_orders * 100) if daily_stats.total_orders > 0 else 0.0
-        )
-        completion_rates.append(completion_rate)
-        error_counts.append(daily_stats.total_orders - daily_stats.complete_orders)
-
-    if dates:
-        df_trend = pd.DataFrame(
-            {
-                "Date": pd.to_datetime(dates),
-                "Taux de complétude (%)": completion_rates,
-                "Nombre d'erreurs": error_counts,
-            }
-        )
-
-        fig_completion = go.Figure()
-        fig_completion.add_trace(
-            go.Scatter(
-                x=df_trend["Date"],
-                y=df_trend["Taux de complétude (%)"],
-                mode="lines+markers",
-                fill="tozeroy",
-                name="Taux de complétude",
-                line=dict(color="#00cc96", width=3),
-                marker=dict(size=6),
-            )
-        )
-        fig_completion.add_hline(
-            y=95, line_dash="dash", line_color="orange", annotation_text="Objectif: 95%", annotation_position="right"
-        )
-        fig_completion.update_layout(
-            title="📈 Évolution du taux de complétude",
-            xaxis_title="Date",
-            yaxis_title="Taux de complétude (%)",
-            height=350,
-            hovermode="x unified",
-        )
-        st.plotly_chart(fig_completion, use_container_width=True)
-
-        fig_errors = go.Figure()
-        fig_errors.add_trace(
-            go.Bar(
-                x=df_trend["Date"],
-                y=df_trend["Nombre d'erreurs"],
-                name="Erreurs",
-                marker_color="#ef553b",
+    features = _build_feature_frame(records)
+    df_trend = features.groupby("date", sort=True).agg(
+        total=("is_complete", "size"),
+        complete=("is_complete", "sum"),
+    )
+    df_trend["Taux de complétude (%)"] = df_trend["complete"] / df_trend["total"] * 100
+    df_trend["Nombre d'erreurs"] = df_trend["total"] - df_trend["complete"]
+    df_trend = df_trend.reset_index().rename(columns={"date": "Date"})
+
+    if not df_trend.empty:
+        df_line = df_trend
+        if len(df_trend) > _TREND_MAX_POINTS:
+            keep = _lttb_indices(
+                df_trend["Date"].to_numpy().astype(np.int64).astype(np.float64),
+                df_trend["Taux de complétude (%)"].to_numpy(dtype=np.float64),
+                _TREND_MAX_POINTS,
             )
+            df_line = df_trend.iloc[keep]
+
+        scatter_trace = go.Scattergl if len(df_line) > _WEBGL_POINT_THRESHOLD else go.Scatter
+        fig_completion = go.Figure(
+            data=[
+                scatter_trace(
+                    x=df_line["Date"],
+                    y=df_line["Taux de complétude (%)"],
+                    mode="lines+markers",
+                    fill="tozeroy",
+                    name="Taux de complétude",
+                    line=dict(color="#00cc96", width=3),
+                    marker=dict(size=6),
+                ),
+            ],
+            layout=go.Layout(
+                title="📈 Évolution du taux de complétude",
+                xaxis_title="Date",
+                yaxis_title="Taux de complétude (%)",
+                height=350,
+                hovermode="x unified",
+                shapes=[_COMPLETION_TARGET_SHAPE],
+                annotations=[_COMPLETION_TARGET_ANNOTATION],
+            ),
         )
-        fig_errors.update_layout(
-            title="📉 Nombre d'erreurs par jour",
-            xaxis_title="Date",
-            yaxis_title="Nombre d'erreurs",
-            height=300,
+        st.plotly_chart(fig_completion, use_container_width=True, key="dashboard_trend_completion")
+
+        fig_errors = go.Figure(
+            data=[
+                go.Bar(
+                    x=df_trend["Date"],
+                    y=df_trend["Nombre d'erreurs"],
+                    name="Erreurs",
+                    marker_color="#ef553b",
+                ),
+            ],
+            layout=go.Layout(
+                title="📉 Nombre d'erreurs par jour",
+                xaxis_title="Date",
+                yaxis_title="Nombre d'erreurs",
+                height=300,
+            ),
         )
-        st.plotly_chart(fig_errors, use_container_width=True)
+        st.plotly_chart(fig_errors, use_container_width=True, key="dashboard_trend_errors")
 
 
 def _render_error_analysis_charts(records: list[ValidationRecord], stats: Statistics) -> None:
     """Render error analysis charts."""
-    missing_count = sum(len(r.comparison_result.missing_items) for r in records if not r.is_complete)
-    too_few_count = sum(len(r.comparison_result.too_few_items) for r in records if not r.is_complete)
-    too_many_count = sum(len(r.comparison_result.too_many_items) for r in records if not r.is_complete)
-    extra_count = sum(len(r.comparison_result.extra_items) for r in records if not r.is_complete)
+    import plotly.express as px  # type: ignore[import-untyped]
+    import plotly.graph_objects as go  # type: ignore[import-untyped]
+
+    features = _build_feature_frame(records)
+    incomplete = features[~features["is_complete"]]
+    missing_count, too_few_count, too_many_count, extra_count = (
+        int(n) for n in incomplete[list(_ERROR_COUNT_COLUMNS)].sum()
+    )
 
     if missing_count + too_few_count + too_many_count + extra_count > 0:
         error_types = {
@@ -632,285 +719,303 @@ def _render_error_analysis_charts(records: list[ValidationRecord], stats: Statis
         )
         fig_pie.update_traces(textposition="inside", textinfo="percent+label")
         fig_pie.update_layout(height=400)
-        st.plotly_chart(fig_pie, use_container_width=True)
+        st.plotly_chart(fig_pie, use_container_width=True, key="dashboard_error_types_pie")
 
     if stats.errors_by_hour and stats.errors_by_day:
-        day_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
         hours = list(range(24))
 
-        heatmap_data: dict[str, dict[int, int]] = {day: {hour: 0 for hour in hours} for day in day_order}
-
-        for record in records:
-            if not record.is_complete:
-                day_name = day_order[record.timestamp.weekday()]
-                hour = record.timestamp.hour
-                heatmap_data[day_name][hour] = heatmap_data[day_name].get(hour, 0) + 1
-
-        z_data = [[heatmap_data[day][hour] for hour in hours] for day in day_order]
+        z_data = np.zeros((len(_DAY_NAMES_EN), len(hours)), dtype=np.int32)
+        np.add.at(z_data, (incomplete["weekday"].to_numpy(), incomplete["hour"].to_numpy()), 1)
 
         fig_heatmap = go.Figure(
             data=go.Heatmap(
                 z=z_data,
                 x=[f"{h}h" for h in hours],
-                y=day_order,
+                y=list(_DAY_NAMES_EN),
                 colorscale="Reds",
                 showscale=True,
                 text=z_data,
                 texttemplate="%{text}",
                 textfont={"size": 10},
-            )
-        )
-        fig_heatmap.update_layout(
-            title="🔥 Heatmap: Erreurs par jour et heure",
-            xaxis_title="Heure",
-            yaxis_title="Jour",
-            height=400,
+            ),
+            layout=go.Layout(
+                title="🔥 Heatmap: Erreurs par jour et heure",
+                xaxis_title="Heure",
+                yaxis_title="Jour",
+                height=400,
+            ),
         )
-        st.plotly_chart(fig_heatmap, use_container_width=True)
+        st.plotly_chart(fig_heatmap, use_container_width=True, key="dashboard_error_heatmap")
 
     if stats.errors_by_hour:
         hours = list(range(24))
         error_counts = [stats.errors_by_hour.get(hour, 0) for hour in hours]
 
-        fig_hours = go.Figure()
         colors = ["#ef553b" if count > 0 else "#bdbdbd" for count in error_counts]
-        fig_hours.add_trace(
-            go.Bar(
-                x=[f"{h}h" for h in hours],
-                y=error_counts,
-                marker_color=colors,
-                text=error_counts,
-                textposition="outside",
-            )
-        )
-        fig_hours.update_layout(
-            title="⏰ Erreurs par heure de la journée",
-            xaxis_title="Heure",
-            yaxis_title="Nombre d'erreurs",
-            height=300,
+        fig_hours = go.Figure(
+            data=[
+                go.Bar(
+                    x=[f"{h}h" for h in hours],
+                    y=error_counts,
+                    marker_color=colors,
+                    text=error_counts,
+                    textposition="outside",
+                ),
+            ],
+            layout=go.Layout(
+                title="⏰ Erreurs par heure de la journée",
+                xaxis_title="Heure",
+                yaxis_title="Nombre d'erreurs",
+                height=300,
+            ),
         )
-        st.plotly_chart(fig_hours, use_container_width=True)
+        st.plotly_chart(fig_hours, use_container_width=True, key="dashboard_errors_by_hour")
 
     if stats.errors_by_day:
-        day_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-        days = [day for day in day_order if day in stats.errors_by_day]
+        days = [day for day in _DAY_NAMES_EN if day in stats.errors_by_day]
         error_counts = [stats.errors_by_day.get(day, 0) for day in days]
-
-        day_names_fr = {
-            "Monday": "Lundi",
-            "Tuesday": "Mardi",
-            "Wednesday": "Mercredi",
-            "Thursday": "Jeudi",
-            "Friday": "Vendredi",
-            "Saturday": "Samedi",
-            "Sunday": "Dimanche",
-        }
-        days_fr = [day_names_fr.get(day, day) for day in days]
-
-        fig_days = go.Figure()
-        fig_days.add_trace(
-            go.Bar(
-                x=days_fr,
-                y=error_counts,
-                marker_color="#ef553b",
-                text=error_counts,
-                textposition="outside",
-            )
-        )
-        fig_days.update_layout(
-            title="📅 Erreurs par jour de la semaine",
-            xaxis_title="Jour",
-            yaxis_title="Nombre d'erreurs",
-            height=300,
+        days_fr = [_DAY_NAMES_EN_TO_FR.get(day, day) for day in days]
+
+        fig_days = go.Figure(
+            data=[
+                go.Bar(
+                    x=days_fr,
+                    y=error_counts,
+                    marker_color="#ef553b",
+                    text=error_counts,
+                    textposition="outside",
+                ),
+            ],
+            layout=go.Layout(
+                title="📅 Erreurs par jour de la semaine",
+                xaxis_title="Jour",
+                yaxis_title="Nombre d'erreurs",
+                height=300,
+            ),
         )
-        st.plotly_chart(fig_days, use_container_width=True)
+        st.plotly_chart(fig_days, use_container_width=True, key="dashboard_errors_by_day")
 
 
 def _render_item_analysis_charts(stats: Statistics) -> None:
     """Render item analysis charts."""
+    import plotly.graph_objects as go  # type: ignore[import-untyped]
+
     if not stats.most_forgotten_items:
         st.info("Aucun article oublié détecté.")
         return
 
     top_items = stats.most_forgotten_items[:10]
-    items_data = [{"Article": item.value, "Nombre d'oublis": count} for item, count in top_items]
-    df_items = pd.DataFrame(items_data)
-
-    fig_items = go.Figure()
-    fig_items.add_trace(
-        go.Bar(
-            y=df_items["Article"],
-            x=df_items["Nombre d'oublis"],
-            orientation="h",
-            marker_color="#ef553b",
-            text=df_items["Nombre d'oublis"],
-            textposition="outside",
-        )
-    )
-    fig_items.update_layout(
-        title="🔴 Top 10 des articles les plus souvent oubliés",
-        xaxis_title="Nombre d'oublis",
-        yaxis_title="Article",
-        height=400,
+    labels = [item.value for item, _ in top_items]
+    counts = [count for _, count in top_items]
+
+    fig_items = go.Figure(
+        data=[
+            go.Bar(
+                y=labels,
+                x=counts,
+                orientation="h",
+                marker_color="#ef553b",
+                text=counts,
+                textposition="outside",
+            ),
+        ],
+        layout=go.Layout(
+            title="🔴 Top 10 des articles les plus souvent oubliés",
+            xaxis_title="Nombre d'oublis",
+            yaxis_title="Article",
+            height=400,
+        ),
     )
-    st.plotly_chart(fig_items, use_container_width=True)
+    st.plotly_chart(fig_items, use_container_width=True, key="dashboard_forgotten_items")
 
     st.markdown("**📋 Détail des articles oubliés**")
-    st.dataframe(df_items, use_container_width=True, hide_index=True)
+    st.dataframe(pd.DataFrame({"Article": labels, "Nombre d'oublis": counts}), use_container_width=True, hide_index=True)
+
+
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False, hash_funcs=_RECORD_HASH_FUNCS)
+def _cached_operator_stats(records: list[ValidationRecord]) -> dict[str, Statistics]:
+    """Per-operator statistics, reused across reruns for the same record set."""
+    return get_statistics_by_operator(records)
+
+
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False, hash_funcs=_RECORD_HASH_FUNCS)
+def _cached_source_stats(records: list[ValidationRecord]) -> dict[str, Statistics]:
+    """Per-source statistics, reused across reruns for the same record set."""
+    return get_statistics_by_source(records)
+
+
+def _stats_frame(label_column: str, labels: list[str], group_stats: list[Statistics]) -> pd.DataFrame:
+    """Build the per-group comparison table column by column.
+
+    Args:
+        label_column: Name of the group label column (e.g. "Opérateur").
+        labels: Group labels, aligned with group_stats.
+        group_stats: Statistics of each group.
+
+    Returns:
+        DataFrame with totals, completion rate and error rate per group.
+    """
+    totals = [s.total_orders for s in group_stats]
+    completes = [s.complete_orders for s in group_stats]
+    return pd.DataFrame(
+        {
+            label_column: labels,
+            "Total commandes": totals,
+            "Commandes complètes": completes,
+            "Taux de complétude (%)": [
+                (complete / total * 100) if total > 0 else 0.0 for complete, total in zip(completes, totals, strict=True)
+            ],
+            "Taux d'erreur (%)": [s.error_rate for s in group_stats],
+        }
+    )
 
 
 def _render_operator_performance(records: list[ValidationRecord]) -> None:
     """Render operator performance analysis."""
+    import plotly.graph_objects as go  # type: ignore[import-untyped]
+
     if not records:
         st.info("Aucune donnée pour afficher la performance des opérateurs.")
         return
 
-    operator_stats = get_statistics_by_operator(records)
+    operator_stats = _cached_operator_stats(records)
 
     if not operator_stats:
         st.info("Aucun opérateur trouvé dans les données.")
         return
 
-    operators_data = []
-    for operator, stats_op in operator_stats.items():
-        completion_rate = (
-            (stats_op.complete_orders / stats_op.total_orders * 100) if stats_op.total_orders > 0 else 0.0
-        )
-        operators_data.append({
-            "Opérateur": operator,
-            "Total commandes": stats_op.total_orders,
-            "Commandes complètes": stats_op.complete_orders,
-            "Taux de complétude (%)": completion_rate,
-            "Taux d'erreur (%)": stats_op.error_rate,
-        })
-
-    df_operators = pd.DataFrame(operators_data)
+    df_operators = _stats_frame("Opérateur", list(operator_stats), list(operator_stats.values()))
     df_operators = df_operators.sort_values("Taux de complétude (%)", ascending=False)
 
-    fig_completion = go.Figure()
-    colors = [
-        "#00cc96" if rate >= 95 else "#ffa15a" if rate >= 90 else "#ef553b"
-        for rate in df_operators["Taux de complétude (%)"]
-    ]
-    fig_completion.add_trace(
-        go.Bar(
-            x=df_operators["Opérateur"],
-            y=df_operators["Taux de complétude (%)"],
-            marker_color=colors,
-            text=[f"{rate:.1f}%" for rate in df_operators["Taux de complétude (%)"]],
-            textposition="outside",
-        )
-    )
-    fig_completion.add_hline(
-        y=95, line_dash="dash", line_color="orange", annotation_text="Objectif: 95%", annotation_position="right"
-    )
-    fig_completion.update_layout(
-        title="📊 Taux de complétude par opérateur",
-        xaxis_title="Opérateur",
-        yaxis_title="Taux de complétude (%)",
-        height=400,
-    )
-    st.plotly_chart(fig_completion, use_container_width=True)
-
-    fig_errors = go.Figure()
-    error_colors = [
-        "#ef553b" if rate > 20 else "#ffa15a" if rate > 10 else "#00cc96"
-        for rate in df_operators["Taux d'erreur (%)"]
-    ]
-    fig_errors.add_trace(
-        go.Bar(
-            x=df_operators["Opérateur"],
-            y=df_operators["Taux d'erreur (%)"],
-            marker_color=error_colors,
-            text=[f"{rate:.1f}%" for rate in df_operators["Taux d'erreur (%)"]],
-            textposition="outside",
-        )
+    completion_rates = df_operators["Taux de complétude (%)"].to_numpy()
+    colors = np.select([completion_rates >= 95, completion_rates >= 90], ["#00cc96", "#ffa15a"], default="#ef553b")
+    fig_completion = go.Figure(
+        data=[
+            go.Bar(
+                x=df_operators["Opérateur"],
+                y=completion_rates,
+                marker_color=colors,
+                texttemplate="%{y:.1f}%",
+                textposition="outside",
+            ),
+        ],
+        layout=go.Layout(
+            title="📊 Taux de complétude par opérateur",
+            xaxis_title="Opérateur",
+            yaxis_title="Taux de complétude (%)",
+            height=400,
+            shapes=[_COMPLETION_TARGET_SHAPE],
+            annotations=[_COMPLETION_TARGET_ANNOTATION],
+        ),
     )
-    fig_errors.update_layout(
-        title="⚠️ Taux d'erreur par opérateur",
-        xaxis_title="Opérateur",
-        yaxis_title="Taux d'erreur (%)",
-        height=400,
+    st.plotly_chart(fig_completion, use_container_width=True, key="dashboard_operator_completion")
+
+    error_rates = df_operators["Taux d'erreur (%)"].to_numpy()
+    error_colors = np.select([error_rates > 20, error_rates > 10], ["#ef553b", "#ffa15a"], default="#00cc96")
+    fig_errors = go.Figure(
+        data=[
+            go.Bar(
+                x=df_operators["Opérateur"],
+                y=error_rates,
+                marker_color=error_colors,
+                texttemplate="%{y:.1f}%",
+                textposition="outside",
+            ),
+        ],
+        layout=go.Layout(
+            title="⚠️ Taux d'erreur par opérateur",
+            xaxis_title="Opérateur",
+            yaxis_title="Taux d'erreur (%)",
+            height=400,
+        ),
     )
-    st.plotly_chart(fig_errors, use_container_width=True)
+    st.plotly_chart(fig_errors, use_container_width=True, key="dashboard_operator_errors")
 
     st.markdown("**📋 Tableau détaillé par opérateur**")
-    st.dataframe(df_operators, use_container_width=True, hide_index=True)
+    st.dataframe(df_operators, use_container_width=True, hide_index=True, column_config=_RATE_COLUMN_CONFIG)
 
     st.markdown("**🔴 Articles les plus oubliés par opérateur**")
-    for operator, stats_op in sorted(operator_stats.items(), key=lambda x: x[1].error_rate, reverse=True):
-        if stats_op.most_forgotten_items:
-            with st.expander(f"{operator} ({stats_op.error_rate:.1f}% erreurs)", expanded=False):
-                items_data = [
-                    {"Article": item.value, "Nombre d'oublis": count}
-                    for item, count in stats_op.most_forgotten_items[:5]
-                ]
-                if items_data:
-                    df_items = pd.DataFrame(items_data)
-                    st.dataframe(df_items, use_container_width=True, hide_index=True)
+    _render_operator_forgotten_items(operator_stats)
+
+
+@st.fragment
+def _render_operator_forgotten_items(operator_stats: dict[str, Statistics]) -> None:
+    """Render the most forgotten items of one operator, picked from a selectbox.
+
+    The picker lists every operator with forgotten items, highest error rate
+    first. Only the selected operator's table is built, and switching operator reruns this
+    fragment alone instead of the whole dashboard.
+    """
+    ranked = sorted(
+        (op for op, stats_op in operator_stats.items() if stats_op.most_forgotten_items),
+        key=lambda op: operator_stats[op].error_rate,
+        reverse=True,
+    )
+    if not ranked:
+        return
+
+    operator = st.selectbox(
+        "Opérateur",
+        options=ranked,
+        format_func=lambda op: f"{op} ({operator_stats[op].error_rate:.1f}% erreurs)",
+    )
+    top_items = operator_stats[operator].most_forgotten_items[:5]
+    df_items = pd.DataFrame(
+        {
+            "Article": [item.value for item, _ in top_items],
+            "Nombre d'oublis": [count for _, count in top_items],
+        }
+    )
+    st.dataframe(df_items, use_container_width=True, hide_index=True)
 
 
 def _render_source_comparison(records: list[ValidationRecord]) -> None:
     """Render source comparison analysis (UberEats vs Deliveroo)."""
+    import plotly.express as px  # type: ignore[import-untyped]
+    import plotly.graph_objects as go  # type: ignore[import-untyped]
+
     if not records:
         st.info("Aucune donnée pour comparer les sources.")
         return
 
-    source_stats = get_statistics_by_source(records)
+    source_stats = _cached_source_stats(records)
 
     if not source_stats:
         st.info("Aucune source trouvée dans les données.")
         return
 
-    sources_data = []
-    for source, stats_source in source_stats.items():
-        completion_rate = (
-            (stats_source.complete_orders / stats_source.total_orders * 100) if stats_source.total_orders > 0 else 0.0
-        )
-        sources_data.append({
-            "Source": source.upper(),
-            "Total commandes": stats_source.total_orders,
-            "Commandes complètes": stats_source.complete_orders,
-            "Taux de complétude (%)": completion_rate,
-            "Taux d'erreur (%)": stats_source.error_rate,
-        })
-
-    df_sources = pd.DataFrame(sources_data)
-
-    fig_comparison = go.Figure()
-
-    fig_comparison.add_trace(
-        go.Bar(
-            name="Taux de complétude",
-            x=df_sources["Source"],
-            y=df_sources["Taux de complétude (%)"],
-            marker_color="#00cc96",
-            text=[f"{rate:.1f}%" for rate in df_sources["Taux de complétude (%)"]],
-            textposition="outside",
-        )
-    )
+    df_sources = _stats_frame("Source", [source.upper() for source in source_stats], list(source_stats.values()))
 
-    fig_comparison.add_trace(
-        go.Bar(
-            name="Taux d'erreur",
-            x=df_sources["Source"],
-            y=df_sources["Taux d'erreur (%)"],
-            marker_color="#ef553b",
-            text=[f"{rate:.1f}%" for rate in df_sources["Taux d'erreur (%)"]],
-            textposition="outside",
-            yaxis="y2",
-        )
-    )
-
-    fig_comparison.update_layout(
-        title="📊 Comparaison UberEats vs Deliveroo",
-        xaxis_title="Source",
-        yaxis=dict(title="Taux de complétude (%)", side="left"),
-        yaxis2=dict(title="Taux d'erreur (%)", side="right", overlaying="y"),
-        barmode="group",
-        height=400,
+    fig_comparison = go.Figure(
+        data=[
+            go.Bar(
+                name="Taux de complétude",
+                x=df_sources["Source"],
+                y=df_sources["Taux de complétude (%)"],
+                marker_color="#00cc96",
+                texttemplate="%{y:.1f}%",
+                textposition="outside",
+            ),
+            go.Bar(
+                name="Taux d'erreur",
+                x=df_sources["Source"],
+                y=df_sources["Taux d'erreur (%)"],
+                marker_color="#ef553b",
+                texttemplate="%{y:.1f}%",
+                textposition="outside",
+                yaxis="y2",
+            ),
+        ],
+        layout=go.Layout(
+            title="📊 Comparaison UberEats vs Deliveroo",
+            xaxis_title="Source",
+            yaxis=dict(title="Taux de complétude (%)", side="left"),
+            yaxis2=dict(title="Taux d'erreur (%)", side="right", overlaying="y"),
+            barmode="group",
+            height=400,
+        ),
     )
-    st.plotly_chart(fig_comparison, use_container_width=True)
+    st.plotly_chart(fig_comparison, use_container_width=True, key="dashboard_source_comparison")
 
     fig_pie = px.pie(
         df_sources,
@@ -921,41 +1026,80 @@ def _render_source_comparison(records: list[ValidationRecord]) -> None:
     )
     fig_pie.update_traces(textposition="inside", textinfo="percent+label+value")
     fig_pie.update_layout(height=400)
-    st.plotly_chart(fig_pie, use_container_width=True)
+    st.plotly_chart(fig_pie, use_container_width=True, key="dashboard_source_pie")
 
     st.markdown("**📋 Tableau comparatif détaillé**")
-    st.dataframe(df_sources, use_container_width=True, hide_index=True)
+    st.dataframe(df_sources, use_container_width=True, hide_index=True, column_config=_RATE_COLUMN_CONFIG)
 
     st.markdown("**🔍 Répartition des types d'erreurs par source**")
-    for source, stats_source in source_stats.items():
-        source_records = [r for r in records if r.expected_order.source.value == source]
-
-        missing_count = sum(len(r.comparison_result.missing_items) for r in source_records if not r.is_complete)
-        too_few_count = sum(len(r.comparison_result.too_few_items) for r in source_records if not r.is_complete)
-        too_many_count = sum(len(r.comparison_result.too_many_items) for r in source_records if not r.is_complete)
-        extra_count = sum(len(r.comparison_result.extra_items) for r in source_records if not r.is_complete)
-
-        if missing_count + too_few_count + too_many_count + extra_count > 0:
-            error_types_data = {
-                "Type d'erreur": ["Articles manquants", "Quantités insuffisantes", "Quantités excessives", "Articles supplémentaires"],
-                "Nombre": [missing_count, too_few_count, too_many_count, extra_count],
-            }
-            df_error_types = pd.DataFrame(error_types_data)
-            df_error_types = df_error_types[df_error_types["Nombre"] > 0]
-
-            if not df_error_types.empty:
-                with st.expander(f"{source.upper()} - Détail des erreurs", expanded=False):
-                    fig_error_types = px.bar(
-                        df_error_types,
-                        x="Type d'erreur",
-                        y="Nombre",
-                        title=f"Types d'erreurs - {source.upper()}",
-                        color="Nombre",
-                        color_continuous_scale="Reds",
-                    )
-                    fig_error_types.update_layout(height=300)
-                    st.plotly_chart(fig_error_types, use_container_width=True)
-                    st.dataframe(df_error_types, use_container_width=True, hide_index=True)
+    features = _build_feature_frame(records)
+    errors_by_source = (
+        features[~features["is_complete"]].groupby("source", sort=False, observed=True)[list(_ERROR_COUNT_COLUMNS)].sum()
+    )
+    for source in source_stats:
+        if source not in errors_by_source.index:
+            continue
+        df_error_types = pd.DataFrame(
+            {"Type d'erreur": list(_ERROR_TYPE_COLUMNS), "Nombre": errors_by_source.loc[source].to_numpy()}
+        )
+        df_error_types = df_error_types[df_error_types["Nombre"] > 0]
+
+        if not df_error_types.empty:
+            with st.expander(f"{source.upper()} - Détail des erreurs", expanded=False):
+                fig_error_types = px.bar(
+                    df_error_types,
+                    x="Type d'erreur",
+                    y="Nombre",
+                    title=f"Types d'erreurs - {source.upper()}",
+                    color="Nombre",
+                    color_continuous_scale="Reds",
+                )
+                fig_error_types.update_layout(height=300)
+                st.plotly_chart(fig_error_types, use_container_width=True, key=f"dashboard_source_error_types_{source}")
+                st.dataframe(df_error_types, use_container_width=True, hide_index=True)
+
+
+@st.cache_data(ttl=300, show_spinner=False, hash_funcs=_RECORD_HASH_FUNCS)
+def _filtered_indices(
+    records: list[ValidationRecord],
+    filters_key: tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]],
+) -> list[int]:
+    """Return positions of records matching the filters, cached per filter selection.
+
+    Filters are combined as boolean masks over the feature frame columns.
+    Indices are cached instead of the records themselves so cache hits don't
+    unpickle a copy of every record.
+
+    Args:
+        records: List of validation records to filter.
+        filters_key: Sorted (operators, sources, error_types) selections.
+
+    Returns:
+        Indices into records of the entries kept by the filters.
+    """
+    operators, sources, error_types = filters_key
+    features = _build_feature_frame(records)
+    mask = np.ones(len(features), dtype=bool)
+
+    if operators:
+        mask &= features["operator"].isin(operators).to_numpy()
+
+    if sources:
+        source_values = [source.value for source in OrderSource if source.value in sources]
+        if source_values:
+            mask &= features["source"].isin(source_values).to_numpy()
+
+    if error_types:
+        is_complete = features["is_complete"].to_numpy()
+        error_mask = np.zeros(len(features), dtype=bool)
+        if "Aucune erreur" in error_types:
+            error_mask |= is_complete
+        for label, column in _ERROR_TYPE_COLUMNS.items():
+            if label in error_types:
+                error_mask |= ~is_complete & (features[column].to_numpy() > 0)
+        mask &= error_mask
+
+    return np.flatnonzero(mask).tolist()
 
 
 def _apply_filters(
@@ -975,42 +1119,12 @@ def _apply_filters(
     Returns:
         Filtered list of validation records.
     """
-    filtered = records
-
-    if operators:
-        filtered = [r for r in filtered if r.operator in operators]
-
-    if sources:
-        source_enums = []
-        if "ubereats" in sources:
-            source_enums.append(OrderSource.UBER_EATS)
-        if "deliveroo" in sources:
-            source_enums.append(OrderSource.DELIVEROO)
-        if source_enums:
-            filtered = [r for r in filtered if r.expected_order.source in source_enums]
-
-    if error_types:
-        filtered_by_error = []
-        for record in filtered:
-            should_include = False
-
-            if "Aucune erreur" in error_types and record.is_complete:
-                should_include = True
-            elif not record.is_complete:
-                if "Articles manquants" in error_types and record.comparison_result.missing_items:
-                    should_include = True
-                if "Quantités insuffisantes" in error_types and record.comparison_result.too_few_items:
-                    should_include = True
-                if "Quantités excessives" in error_types and record.comparison_result.too_many_items:
-                    should_include = True
-                if "Articles supplémentaires" in error_types and record.comparison_result.extra_items:
-                    should_include = True
-
-            if should_include:
-                filtered_by_error.append(record)
-        filtered = filtered_by_error
-
-    return filtered
+    filters_key = (
+        tuple(sorted(operators or ())),
+        tuple(sorted(sources or ())),
+        tuple(sorted(error_types or ())),
+    )
+    return [records[i] for i in _filtered_indices(records, filters_key)]
 
 
 __all__ = ["render_dashboard"]
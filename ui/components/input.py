@@ -1,8 +1,30 @@
 """Image input primitive - reusable file upload and camera input component."""
 
+import io
+
 import streamlit as st
 from PIL import Image
 
+from ui.utils.image import FINGERPRINT_INFO_KEY, image_fingerprint
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _decode_image(data: bytes) -> Image.Image:
+    """Decode uploaded image bytes, cached so reruns skip the JPEG/PNG parse.
+
+    The fingerprint of the uploaded bytes is stored in ``image.info`` so
+    callers deduplicating uploads never hash or re-encode the pixels.
+
+    Args:
+        data: Raw bytes of the uploaded or captured image.
+
+    Returns:
+        Fully loaded PIL Image (detached from the underlying buffer).
+    """
+    image = Image.open(io.BytesIO(data)).copy()
+    image.info[FINGERPRINT_INFO_KEY] = image_fingerprint(data)
+    return image
+
 
 def render_image_input(
     key_prefix: str,
@@ -51,7 +73,7 @@ def render_image_input(
             help=file_help,
         )
         if uploaded_file:
-            image = Image.open(uploaded_file)
+            image = _decode_image(uploaded_file.getvalue())
             source = "fichier"
 
         # Toggle button below file uploader
@@ -65,7 +87,7 @@ def render_image_input(
             help=camera_help,
         )
         if camera_image:
-            image = Image.open(camera_image)
+            image = _decode_image(camera_image.getvalue())
             source = "caméra"
 
         # Toggle button below camera input
@@ -1,5 +1,7 @@
 """Order comparison component - unified visual comparison of orders."""
 
+import html
+
 import streamlit as st
 
 from staff_meal.models import Order
@@ -17,115 +19,56 @@ def render_order_comparison(expected: Order, detected: Order) -> None:
         expected: Expected order from QR code.
         detected: Detected order from bag image.
     """
-    # Build detected items dict for quick lookup
-    detected_items: dict[str, int] = {}
-    for item in detected.items:
-        detected_items[item.item.value] = item.quantity
-
-    # Build expected items set for extra items check
-    expected_item_names = {item.item.value for item in expected.items}
-
-    # Container with card-like styling
-    with st.container():
-        st.markdown(
-            '<div style="background-color: #f0f2f6; padding: 20px; border-radius: 10px; margin: 20px 0;">',
-            unsafe_allow_html=True,
+    detected_items = detected.items_by_name()
+    expected_item_names = expected.items_by_name().keys()
+
+    # One row per expected item, colored by how the detected quantity compares
+    rows = []
+    for expected_item in expected.items:
+        item_name = expected_item.item.value
+        expected_qty = expected_item.quantity
+        detected_qty = detected_items.get(item_name, 0)
+
+        if expected_qty == detected_qty:
+            qty_color, status_text, status_color = "#00cc00", "✅", "#00cc00"
+        elif detected_qty == 0:
+            qty_color, status_text, status_color = "#ff4444", "❌", "#ff4444"
+        else:
+            qty_color, status_text, status_color = "#ff4444", "⚠️", "#ff8800"
+
+        rows.append(
+            f"<tr><td><strong>{html.escape(item_name)}</strong></td>"
+            f"<td>{expected_qty}x</td>"
+            f'<td style="color: {qty_color}; font-weight: bold;">{detected_qty}x</td>'
+            f'<td style="color: {status_color}; font-size: 20px;">{status_text}</td></tr>'
         )
 
-        st.markdown("#### 📊 Comparaison des articles")
-
-        # Header row
-        col1, col2, col3, col4 = st.columns([3, 1.5, 1.5, 1])
-        with col1:
-            st.markdown("**Article**")
-        with col2:
-            st.markdown("**Attendu**")
-        with col3:
-            st.markdown("**Détecté**")
-        with col4:
-            st.markdown("**Statut**")
-
-        st.divider()
-
-        # Compare each expected item
-        for expected_item in expected.items:
-            item_name = expected_item.item.value
-            expected_qty = expected_item.quantity
-            detected_qty = detected_items.get(item_name, 0)
-            is_match = expected_qty == detected_qty
-
-            col1, col2, col3, col4 = st.columns([3, 1.5, 1.5, 1])
-
-            with col1:
-                st.markdown(f"**{item_name}**")
-
-            with col2:
-                st.markdown(f"{expected_qty}x")
-
-            with col3:
-                if is_match:
-                    st.markdown(
-                        f'<div style="color: #00cc00; font-weight: bold;">{detected_qty}x</div>',
-                        unsafe_allow_html=True,
-                    )
-                else:
-                    st.markdown(
-                        f'<div style="color: #ff4444; font-weight: bold;">{detected_qty}x</div>',
-                        unsafe_allow_html=True,
-                    )
-
-            with col4:
-                if is_match:
-                    st.markdown(
-                        '<div style="color: #00cc00; font-size: 20px;">✅</div>',
-                        unsafe_allow_html=True,
-                    )
-                else:
-                    if detected_qty == 0:
-                        status_text = "❌"
-                        status_color = "#ff4444"
-                    elif detected_qty < expected_qty:
-                        status_text = "⚠️"
-                        status_color = "#ff8800"
-                    else:
-                        status_text = "⚠️"
-                        status_color = "#ff8800"
-                    st.markdown(
-                        f'<div style="color: {status_color}; font-size: 20px;">{status_text}</div>',
-                        unsafe_allow_html=True,
-                    )
-
-        # Check for extra items (detected but not in expected)
-        extra_items = [
-            item for item in detected.items if item.item.value not in expected_item_names
-        ]
-
-        # Display extra items
-        for extra_item in extra_items:
-            col1, col2, col3, col4 = st.columns([3, 1.5, 1.5, 1])
-
-            with col1:
-                st.markdown(
-                    f'<div style="color: #ff8800;">**{extra_item.item.value}**</div>',
-                    unsafe_allow_html=True,
-                )
-
-            with col2:
-                st.markdown('<div style="color: #999;">—</div>', unsafe_allow_html=True)
-
-            with col3:
-                st.markdown(
-                    f'<div style="color: #ff8800; font-weight: bold;">{extra_item.quantity}x</div>',
-                    unsafe_allow_html=True,
-                )
-
-            with col4:
-                st.markdown(
-                    '<div style="color: #ff8800; font-size: 20px;">⚠️</div>',
-                    unsafe_allow_html=True,
-                )
+    # Extra items (detected but not in expected)
+    for extra_item in detected.items:
+        if extra_item.item.value in expected_item_names:
+            continue
+        rows.append(
+            f'<tr><td style="color: #ff8800;"><strong>{html.escape(extra_item.item.value)}</strong></td>'
+            '<td style="color: #999;">—</td>'
+            f'<td style="color: #ff8800; font-weight: bold;">{extra_item.quantity}x</td>'
+            '<td style="color: #ff8800; font-size: 20px;">⚠️</td></tr>'
+        )
 
-        st.markdown("</div>", unsafe_allow_html=True)
+    # Single card-styled table so the whole comparison is sent as one element
+    st.markdown("#### 📊 Comparaison des articles")
+    st.markdown(
+        '<div style="background-color: #f0f2f6; padding: 20px; border-radius: 10px; margin: 20px 0;">'
+        '<table style="width: 100%; border-collapse: collapse;">'
+        "<thead><tr>"
+        '<th style="width: 43%; text-align: left;">Article</th>'
+        '<th style="width: 21%; text-align: left;">Attendu</th>'
+        '<th style="width: 21%; text-align: left;">Détecté</th>'
+        '<th style="width: 15%; text-align: left;">Statut</th>'
+        "</tr></thead>"
+        f"<tbody>{''.join(rows)}</tbody>"
+        "</table></div>",
+        unsafe_allow_html=True,
+    )
 
 
 __all__ = ["render_order_comparison"]
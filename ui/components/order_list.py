@@ -4,23 +4,35 @@ import streamlit as st
 
 from staff_meal.models import Order
 from staff_meal.order_storage import get_all_orders
-from staff_meal.qr import generate_qr
 from ui.components.output import render_order_details
+from ui.components.qr_generator import qr_png_bytes
 from ui.utils import runner
-from ui.utils.image import pil_image_to_bytes
 
 
+@st.cache_data(ttl=30, max_entries=4, show_spinner=False)  # Cache for 30 seconds
+def _load_orders(limit: int) -> list[Order]:
+    """Load the most recent saved orders with caching."""
+    return runner.run(get_all_orders(limit=limit))
+
+
+@st.fragment
 def render_order_list() -> None:
     """Render list of saved orders with ability to regenerate QR codes."""
     st.markdown(
         '<div style="text-align: center; font-size: 48px; font-weight: bold; margin: 20px 0;">📋 Commandes sauvegardées</div>',
         unsafe_allow_html=True,
     )
+    _, col_refresh = st.columns([4, 1])
+    with col_refresh:
+        if st.button("🔄 Actualiser", key="order_list_refresh", width="stretch"):
+            _load_orders.clear()
+            st.rerun()
+
     st.divider()
 
     # Load saved orders
     with st.spinner("Chargement des commandes..."):
-        orders = runner.run(get_all_orders(limit=100))
+        orders = _load_orders(100)
 
     if not orders:
         st.info("Aucune commande sauvegardée. Créez une commande dans le mode démo pour commencer.")
@@ -48,12 +60,9 @@ def render_order_list() -> None:
             with col2:
                 st.markdown("<br>", unsafe_allow_html=True)
                 if st.button("📱 Régénérer QR", key=f"regenerate_{idx}", width="stretch"):
-                    # Generate QR code
-                    qr_image = generate_qr(order)
-
-                    # Store in session state for display
+                    # Store the QR PNG in session state for display; reruns reuse the bytes
                     st.session_state.selected_order = order
-                    st.session_state.selected_qr = qr_image
+                    st.session_state.selected_qr_bytes = qr_png_bytes(order)
                     st.session_state.show_qr = True
 
             # Show order details if expanded
@@ -63,11 +72,11 @@ def render_order_list() -> None:
             st.divider()
 
     # Display QR code if one was selected
-    if st.session_state.get("show_qr") and "selected_qr" in st.session_state:
+    if st.session_state.get("show_qr") and "selected_qr_bytes" in st.session_state:
         st.markdown("#### 📱 QR Code régénéré")
         col1, col2, col3 = st.columns([1, 1, 1])
         with col2:
-            img_bytes = pil_image_to_bytes(st.session_state.selected_qr)
+            img_bytes = st.session_state.selected_qr_bytes
             st.image(img_bytes, width=300)
 
         if "selected_order" in st.session_state:
@@ -87,8 +96,8 @@ def render_order_list() -> None:
         with col2:
             if st.button("🔄 Fermer", width="stretch"):
                 st.session_state.show_qr = False
-                if "selected_qr" in st.session_state:
-                    del st.session_state.selected_qr
+                if "selected_qr_bytes" in st.session_state:
+                    del st.session_state.selected_qr_bytes
                 if "selected_order" in st.session_state:
                     del st.session_state.selected_order
 
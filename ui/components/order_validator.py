@@ -1,10 +1,12 @@
 """Order validation component - validate order with bag image."""
 
-import hashlib
-import io
+import secrets
+from concurrent.futures import Future
+from typing import Any
 
 import streamlit as st
 
+from staff_meal.models import ComparisonResult, Order
 from staff_meal.storage import save_validation_result
 from ui.components.bag_input import render_bag_image_input
 from ui.components.input import render_image_input
@@ -13,184 +15,271 @@ from ui.components.output import render_order_details
 from ui.components.validation_result import render_validation_result
 from celeste.exceptions import MissingCredentialsError
 
-from ui.services import compare_orders, predict_order, read_qr_order
-from ui.utils import runner
+from ui.services import compare_orders, predict_order, read_qr_order, warm_up_prediction_client
+from ui.utils import image_fingerprint, pil_image_to_bytes, runner
+
+
+def _save_is_usable(future: Future[Any]) -> bool:
+    """Drop failed saves from the cache so the next rerun retries the write."""
+    return not future.done() or future.exception() is None
+
+
+@st.cache_resource(max_entries=32, show_spinner=False, validate=_save_is_usable)
+def _submit_validation_save(
+    save_key: str,
+    _expected_order: Order,
+    _detected_order: Order,
+    _comparison_result: ComparisonResult,
+) -> Future[Any]:
+    """Start saving a validation result once per validation run.
+
+    Only save_key is hashed (underscore arguments are skipped by st.cache_resource),
+    so reruns of the result step share one write. The key includes the session's
+    run ID, which changes on RETOUR and "Nouvelle validation", so a later
+    validation of the same images is saved again. The save runs in the
+    background while the result is rendered.
+
+    Args:
+        save_key: Run ID plus QR and bag image fingerprints identifying this validation.
+        _expected_order: Expected order from QR code.
+        _detected_order: Detected order from bag image.
+        _comparison_result: Result of comparison.
+
+    Returns:
+        Future resolving once the validation record is stored.
+    """
+    return runner.submit(
+        save_validation_result(
+            expected_order=_expected_order,
+            detected_order=_detected_order,
+            comparison_result=_comparison_result,
+            operator=None,  # Could be added from user input in future
+        )
+    )
+
+
+def _start_validation_run() -> None:
+    """Give the session a fresh validation run ID, so its result is saved once more."""
+    st.session_state.validator_run_id = secrets.token_hex(8)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _compare_orders_cached(
+    _expected_order: Order,
+    _detected_order: Order,
+    expected_key: str,
+    detected_key: str,
+) -> ComparisonResult:
+    """Compare two orders, cached on their contents across result step reruns.
+
+    Args:
+        _expected_order: Expected order from QR code (not hashed).
+        _detected_order: Detected order from bag image (not hashed).
+        expected_key: JSON dump of the expected order.
+        detected_key: JSON dump of the detected order.
+
+    Returns:
+        Comparison result.
+    """
+    return compare_orders(_expected_order, _detected_order)
+
+
+@st.fragment
+def _render_qr_step() -> None:
+    """Render step 1: scan the QR code of the expected order."""
+    st.markdown(
+        '<div style="text-align: center; font-size: 36px; font-weight: bold; margin: 20px 0;">📤 Scanner le QR Code</div>',
+        unsafe_allow_html=True,
+    )
+
+    qr_image = render_image_input(
+        key_prefix="validator",
+        file_label="Télécharger une image",
+        camera_label="Prendre une photo",
+        file_help="Télécharger la photo du QR code",
+        camera_help="Prendre une photo du QR code avec la caméra",
+        preview_caption="QR Code",
+        toggle_to_camera_label="📷 Scanner un QR code",
+        toggle_to_file_label="📁 Importer un QR code",
+    )
+
+    if qr_image:
+        img_hash = image_fingerprint(qr_image)
+        last_processed_hash = st.session_state.get("validator_qr_image_hash")
+
+        if img_hash != last_processed_hash:
+            with st.spinner("🔍 Lecture du QR code..."):
+                try:
+                    order = read_qr_order(qr_image)
+                    st.session_state.validator_order = order
+                    st.session_state.validator_error = None
+                    st.session_state.validator_qr_image_hash = img_hash
+                    st.session_state.validator_step = 2
+                    # Step 2 needs the prediction client; set it up while the bag photo is taken
+                    warm_up_prediction_client()
+                    st.rerun()
+                except ValueError as e:
+                    st.session_state.validator_error = str(e)
+                    st.error(f"❌ QR code non reconnu: {e}")
+                    st.session_state.validator_qr_image_hash = img_hash  # Mark as processed to avoid retry loop
+    elif st.session_state.get("validator_error"):
+        st.error(f"❌ {st.session_state.validator_error}")
+
+
+@st.fragment
+def _render_bag_step() -> None:
+    """Render step 2: capture the bag image and extract the detected order."""
+    st.markdown(
+        '<div style="text-align: center; font-size: 36px; font-weight: bold; margin: 20px 0;">📸 Image de la commande</div>',
+        unsafe_allow_html=True,
+    )
+
+    if st.button("← RETOUR", width="stretch", help="Retourner à l'étape 1 pour scanner un nouveau QR code"):
+        st.session_state.validator_step = 1
+        st.session_state.validator_order = None
+        _start_validation_run()
+        st.rerun()
 
+    st.divider()
 
-def render_order_validator() -> None:
-    """Render order validation form with sequential steps: QR → Image → Results."""
-    if "validator_step" not in st.session_state:
-        st.session_state.validator_step = 1
+    if "validator_order" in st.session_state and st.session_state.validator_order:
+        render_order_details(st.session_state.validator_order)
+        st.divider()
 
-    if st.session_state.validator_step == 1:
-        st.markdown(
-            '<div style="text-align: center; font-size: 36px; font-weight: bold; margin: 20px 0;">📤 Scanner le QR Code</div>',
-            unsafe_allow_html=True,
-        )
+    bag_image = render_bag_image_input(key_prefix="validator", title="")
 
-        qr_image = render_image_input(
-            key_prefix="validator",
-            file_label="Télécharger une image",
-            camera_label="Prendre une photo",
-            file_help="Télécharger la photo du QR code",
-            camera_help="Prendre une photo du QR code avec la caméra",
-            preview_caption="QR Code",
-            toggle_to_camera_label="📷 Scanner un QR code",
-            toggle_to_file_label="📁 Importer un QR code",
+    if bag_image:
+        img_hash = image_fingerprint(bag_image)
+        last_processed_hash = st.session_state.get("validator_bag_image_hash")
+
+        if img_hash != last_processed_hash:
+            st.session_state.validator_bag_image_bytes = pil_image_to_bytes(bag_image).getvalue()
+            with st.spinner("🔍 Extraction de la commande en cours..."):
+                expected_order = st.session_state.validator_order
+                try:
+                    detected_order = predict_order(bag_image, expected_order=expected_order)
+                    st.session_state.validator_detected_order = detected_order
+                    st.session_state.validator_bag_image_hash = img_hash
+                    st.session_state.validator_step = 3
+                    st.rerun()
+                except MissingCredentialsError:
+                    st.warning(
+                        "⚠️ **API Key manquante** : Veuillez configurer la clé API pour Image Intelligence "
+                        "dans la barre latérale (section ⚙️ Celeste AI config) ou définir la variable "
+                        "d'environnement pour le fournisseur."
+                    )
+                    st.stop()
+
+
+@st.fragment
+def _render_result_step() -> None:
+    """Render step 3: compare orders, save the result and show the report."""
+    # Compute comparison result early to determine icon for title
+    comparison_result = None
+    if (
+        "validator_detected_order" in st.session_state
+        and st.session_state.validator_detected_order
+        and "validator_order" in st.session_state
+        and st.session_state.validator_order
+    ):
+        comparison_result = _compare_orders_cached(
+            st.session_state.validator_order,
+            st.session_state.validator_detected_order,
+            st.session_state.validator_order.model_dump_json(),
+            st.session_state.validator_detected_order.model_dump_json(),
         )
 
-        if qr_image:
-            img_bytes = io.BytesIO()
-            qr_image.save(img_bytes, format="PNG")
-            img_hash = hashlib.md5(img_bytes.getvalue(), usedforsecurity=False).hexdigest()  # nosec B324
-            last_processed_hash = st.session_state.get("validator_qr_image_hash")
-
-            if img_hash != last_processed_hash:
-                with st.spinner("🔍 Lecture du QR code..."):
-                    try:
-                        order = read_qr_order(qr_image)
-                        st.session_state.validator_order = order
-                        st.session_state.validator_error = None
-                        st.session_state.validator_qr_image_hash = img_hash
-                        st.session_state.validator_step = 2
-                        st.rerun()
-                    except ValueError as e:
-                        st.session_state.validator_error = str(e)
-                        st.error(f"❌ QR code non reconnu: {e}")
-                        st.session_state.validator_qr_image_hash = img_hash  # Mark as processed to avoid retry loop
-        elif st.session_state.get("validator_error"):
-            st.error(f"❌ {st.session_state.validator_error}")
-
-    elif st.session_state.validator_step == 2:
-        st.markdown(
-            '<div style="text-align: center; font-size: 36px; font-weight: bold; margin: 20px 0;">📸 Image de la commande</div>',
-            unsafe_allow_html=True,
+    # Determine icon based on validation status
+    icon = "✅" if comparison_result and comparison_result.is_complete else "❌" if comparison_result else "📋"
+    st.markdown(
+        f'<div style="text-align: center; font-size: 36px; font-weight: bold; margin: 20px 0;">{icon} Résultat de la validation</div>',
+        unsafe_allow_html=True,
+    )
+
+    if st.button("← RETOUR", width="stretch", help="Retourner à l'étape 2 pour reprendre une photo"):
+        st.session_state.validator_step = 2
+        st.session_state.validator_detected_order = None
+        _start_validation_run()
+        st.rerun()
+
+    st.divider()
+
+    if comparison_result:
+        save_future = _submit_validation_save(
+            f"{st.session_state.validator_run_id}:"
+            f"{st.session_state.validator_qr_image_hash}:{st.session_state.validator_bag_image_hash}",
+            st.session_state.validator_order,
+            st.session_state.validator_detected_order,
+            comparison_result,
         )
 
-        if st.button("← RETOUR", width="stretch", help="Retourner à l'étape 1 pour scanner un nouveau QR code"):
-            st.session_state.validator_step = 1
-            st.session_state.validator_order = None
-            st.rerun()
+        render_validation_result(
+            is_complete=comparison_result.is_complete,
+            comparison_result=comparison_result,
+            expected_order=st.session_state.validator_order,
+            detected_order=st.session_state.validator_detected_order,
+        )
 
         st.divider()
 
-        if "validator_order" in st.session_state and st.session_state.validator_order:
-            render_order_details(st.session_state.validator_order)
-            st.divider()
-
-        bag_image = render_bag_image_input(key_prefix="validator", title="")
-
-        if bag_image:
-            img_bytes = io.BytesIO()
-            bag_image.save(img_bytes, format="PNG")
-            img_hash = hashlib.md5(img_bytes.getvalue(), usedforsecurity=False).hexdigest()  # nosec B324
-            last_processed_hash = st.session_state.get("validator_bag_image_hash")
-
-            if img_hash != last_processed_hash:
-                st.session_state.validator_bag_image = bag_image
-                with st.spinner("🔍 Extraction de la commande en cours..."):
-                    expected_order = st.session_state.validator_order
-                    try:
-                        detected_order = predict_order(bag_image, expected_order=expected_order)
-                        st.session_state.validator_detected_order = detected_order
-                        st.session_state.validator_bag_image_hash = img_hash
-                        st.session_state.validator_step = 3
-                        st.rerun()
-                    except MissingCredentialsError:
-                        st.warning(
-                            "⚠️ **API Key manquante** : Veuillez configurer la clé API pour Image Intelligence "
-                            "dans la barre latérale (section ⚙️ Celeste AI config) ou définir la variable "
-                            "d'environnement pour le fournisseur."
-                        )
-                        st.stop()
-
-    elif st.session_state.validator_step == 3:
-        # Compute comparison result early to determine icon for title
-        comparison_result = None
-        if (
-            "validator_detected_order" in st.session_state
-            and st.session_state.validator_detected_order
-            and "validator_order" in st.session_state
-            and st.session_state.validator_order
-        ):
-            comparison_result = compare_orders(
-                st.session_state.validator_order,
-                st.session_state.validator_detected_order,
-            )
+        col1, col2 = st.columns(2)
 
-        # Determine icon based on validation status
-        icon = "✅" if comparison_result and comparison_result.is_complete else "❌" if comparison_result else "📋"
-        st.markdown(
-            f'<div style="text-align: center; font-size: 36px; font-weight: bold; margin: 20px 0;">{icon} Résultat de la validation</div>',
-            unsafe_allow_html=True,
-        )
+        with col1:
+            st.markdown("#### 📸 Image de la commande")
+            if st.session_state.get("validator_bag_image_bytes"):
+                st.image(
+                    st.session_state.validator_bag_image_bytes,
+                    caption="Image de la commande",
+                    width="stretch",
+                )
 
-        if st.button("← RETOUR", width="stretch", help="Retourner à l'étape 2 pour reprendre une photo"):
-            st.session_state.validator_step = 2
-            st.session_state.validator_detected_order = None
-            st.rerun()
+        with col2:
+            if "validator_order" in st.session_state and st.session_state.validator_order:
+                render_order_details(st.session_state.validator_order)
 
         st.divider()
 
-        if comparison_result:
-
-            if "validator_saved" not in st.session_state or not st.session_state.validator_saved:
-                try:
-                    runner.run(
-                        save_validation_result(
-                            expected_order=st.session_state.validator_order,
-                            detected_order=st.session_state.validator_detected_order,
-                            comparison_result=comparison_result,
-                            operator=None,  # Could be added from user input in future
-                        )
-                    )
-                    st.session_state.validator_saved = True
-                except Exception as e:
-                    st.warning(f"⚠️ Impossible de sauvegarder le résultat: {e}")
-
-            render_validation_result(
-                is_complete=comparison_result.is_complete,
-                comparison_result=comparison_result,
-                expected_order=st.session_state.validator_order,
-                detected_order=st.session_state.validator_detected_order,
+        with st.expander("📊 Voir la comparaison détaillée", expanded=True):
+            render_order_comparison(
+                st.session_state.validator_order,
+                st.session_state.validator_detected_order,
             )
 
-            st.divider()
+        # The save ran while the result was rendered; only now wait for it
+        try:
+            save_future.result()
+        except Exception as e:
+            st.warning(f"⚠️ Impossible de sauvegarder le résultat: {e}")
 
-            col1, col2 = st.columns(2)
+    st.divider()
+    if st.button("🔄 Nouvelle validation", type="primary", width="stretch"):
+        st.session_state.validator_step = 1
+        st.session_state.validator_order = None
+        st.session_state.validator_detected_order = None
+        st.session_state.validator_bag_image_bytes = None
+        st.session_state.validator_error = None
+        st.session_state.validator_qr_image_hash = None
+        st.session_state.validator_bag_image_hash = None
+        _start_validation_run()
+        st.rerun()
 
-            with col1:
-                st.markdown("#### 📸 Image de la commande")
-                if "validator_bag_image" in st.session_state and st.session_state.validator_bag_image:
-                    st.image(
-                        st.session_state.validator_bag_image,
-                        caption="Image de la commande",
-                        width="stretch",
-                    )
 
-            with col2:
-                if "validator_order" in st.session_state and st.session_state.validator_order:
-                    render_order_details(st.session_state.validator_order)
+_STEP_RENDERERS = {1: _render_qr_step, 2: _render_bag_step, 3: _render_result_step}
 
-            st.divider()
 
-            with st.expander("📊 Voir la comparaison détaillée", expanded=True):
-                render_order_comparison(
-                    st.session_state.validator_order,
-                    st.session_state.validator_detected_order,
-                )
+@st.fragment
+def render_order_validator() -> None:
+    """Render order validation form with sequential steps: QR → Image → Results.
 
-        st.divider()
-        if st.button("🔄 Nouvelle validation", type="primary", width="stretch"):
-            st.session_state.validator_step = 1
-            st.session_state.validator_order = None
-            st.session_state.validator_detected_order = None
-            st.session_state.validator_bag_image = None
-            st.session_state.validator_error = None
-            st.session_state.validator_saved = False
-            st.session_state.validator_qr_image_hash = None
-            st.session_state.validator_bag_image_hash = None
-            st.rerun()
+    Each step is a fragment, so interacting with a step's widgets reruns only
+    that step. Moving between steps triggers a full rerun through this dispatcher.
+    """
+    if "validator_step" not in st.session_state:
+        st.session_state.validator_step = 1
+    if "validator_run_id" not in st.session_state:
+        _start_validation_run()
+
+    _STEP_RENDERERS[st.session_state.validator_step]()
 
 
 __all__ = ["render_order_validator"]
@@ -13,12 +13,35 @@ def render_order_details(order: Order) -> None:
     Args:
         order: Order object to display.
     """
-    st.markdown("#### 📋 Détails de la commande")
-    st.markdown(f"**N° Commande:** {order.order_id}")
-    st.markdown(f"**Plateforme:** {order.source.value}")
-    st.markdown("**Articles:**")
-    for item in order.items:
-        st.markdown(f"- {item.quantity}x {item.item.value}")
+    # One markdown element instead of one per line keeps the delta count constant
+    items_list = "\n".join(f"- {item.quantity}x {item.item.value}" for item in order.items)
+    st.markdown(
+        "\n\n".join(
+            [
+                "#### 📋 Détails de la commande",
+                f"**N° Commande:** {order.order_id}",
+                f"**Plateforme:** {order.source.value}",
+                "**Articles:**",
+                items_list,
+            ]
+        )
+    )
+
+
+def _render_image_artifact(artifact: Any) -> bool:
+    """Display an image artifact from its data, falling back to its URL.
+
+    Args:
+        artifact: ImageArtifact to display.
+
+    Returns:
+        True if the artifact had an image to display.
+    """
+    source = artifact.data if artifact.data is not None else artifact.url
+    if not source:
+        return False
+    st.image(source, width=400, caption="Image d'exemple de la commande")
+    return True
 
 
 def render_image_output(output: Any) -> None:
@@ -31,40 +54,21 @@ def render_image_output(output: Any) -> None:
     from celeste.artifacts import ImageArtifact
 
     # Celeste output should handle its own rendering
-    # If it has a render method, use it
     if hasattr(output, "render"):
         output.render()
         return
 
-    # Check if output has content attribute
     if not hasattr(output, "content"):
         st.error("⚠️ Format de sortie non reconnu")
         return
 
-    # output.content is a single ImageArtifact, not a list
-    artifact = output.content
-    if isinstance(artifact, ImageArtifact):
-        # Try data first (bytes or PIL Image)
-        if artifact.data is not None:
-            st.image(artifact.data, width=400, caption="Image d'exemple de la commande")
+    # Content is usually a single ImageArtifact, sometimes a list of them
+    content = output.content
+    artifacts = content if isinstance(content, list) else [content]
+    for artifact in artifacts:
+        if isinstance(artifact, ImageArtifact) and _render_image_artifact(artifact):
             return
-        # Fallback to URL
-        if artifact.url:
-            st.image(artifact.url, width=400, caption="Image d'exemple de la commande")
-            return
-
-    # If content is a list, iterate over it
-    if isinstance(output.content, list):
-        for item in output.content:
-            if isinstance(item, ImageArtifact):
-                if item.data is not None:
-                    st.image(item.data, width=400, caption="Image d'exemple de la commande")
-                    return
-                if item.url:
-                    st.image(item.url, width=400, caption="Image d'exemple de la commande")
-                    return
 
     st.warning("⚠️ Aucune image trouvée dans la sortie")
 
-
 __all__ = ["render_order_details", "render_image_output"]
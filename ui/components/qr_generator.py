@@ -1,11 +1,14 @@
 """QR code generator component - create order and generate QR code."""
 
-import random
+import functools
+import io
+import secrets
+from concurrent.futures import Future
 from typing import Any
 
+import pandas as pd  # type: ignore[import-untyped]
 import streamlit as st
 
-from celeste import create_client
 from celeste.artifacts import ImageArtifact
 from celeste.core import Capability
 from celeste.exceptions import MissingCredentialsError
@@ -14,26 +17,19 @@ from staff_meal.models import Item, Order, OrderItem, OrderSource
 from staff_meal.order_storage import get_all_orders, save_order
 from staff_meal.qr import generate_qr
 from ui.components.output import render_image_output, render_order_details
-from ui.services.client_config import get_client_config
+from ui.services.client_config import get_client, get_client_config, usable_api_key
 from ui.utils import runner
 from ui.utils.image import pil_image_to_bytes
 
-
-def _generate_order_id() -> str:
-    """Generate a unique order ID."""
-    suffix = random.randint(10000, 99999)  # nosec B311
-    return f"ORD-{suffix}"
-
-
-def _format_order_prompt(order: Order) -> str:
-    """Format order items into a prompt for image generation."""
-    items_text = "\n".join(f"- {item.quantity}x {item.item.value}" for item in order.items)
-    available_items = "\n".join(f"- {item.value}" for item in Item)
-
-    prompt_parts = [
-        "Generate a realistic image of a restaurant takeout meal showing ONLY the items from this order:",
-        "",
-        items_text,
+# The menu is fixed, so its reference list is rendered once at import
+_AVAILABLE_ITEMS_TEXT = "\n".join(f"- {item.value}" for item in Item)
+_ITEM_VALUES = [item.value for item in Item]
+_SOURCE_LABELS = {OrderSource.UBER_EATS: "UberEats", OrderSource.DELIVEROO: "Deliveroo"}
+_SOURCE_OPTIONS = tuple(_SOURCE_LABELS)
+# Static image prompt boilerplate around the per-order item list
+_PROMPT_PREFIX = "Generate a realistic image of a restaurant takeout meal showing ONLY the items from this order:\n"
+_PROMPT_SUFFIX = "\n".join(
+    [
         "",
         "CRITICAL REQUIREMENTS - DO NOT GENERATE EXTRA ITEMS:",
         "- Show ONLY the items listed above, nothing else",
@@ -41,7 +37,7 @@ def _format_order_prompt(order: Order) -> str:
         "- Do NOT generate any items from the available menu list below unless they are in the order above",
         "",
         "Available menu items (for reference - do NOT generate these unless in order):",
-        available_items,
+        _AVAILABLE_ITEMS_TEXT,
         "",
         "CRITICAL PACKAGING REQUIREMENTS:",
         "- Show items in their actual packaging format as indicated by the item names",
@@ -58,38 +54,313 @@ def _format_order_prompt(order: Order) -> str:
         "",
         "The image must show EXACTLY the indicated quantities of boxes/containers for each item, and NOTHING ELSE.",
     ]
+)
+
+
+@st.cache_data(ttl=60, max_entries=4, show_spinner=False)  # Cache for 60 seconds
+def _load_saved_orders(limit: int) -> list[Order]:
+    """Load the most recent saved orders for the selectbox with caching."""
+    return runner.run(get_all_orders(limit=limit))
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _qr_png_bytes(_order: Order, order_key: str) -> bytes:
+    """Encode an order's QR code to PNG, cached on the order contents.
+
+    Args:
+        _order: Order to encode (not hashed by st.cache_data).
+        order_key: JSON dump of the order, identifying its contents.
+
+    Returns:
+        PNG bytes of the QR code.
+    """
+    # QR codes are two-colour, so the fastest deflate level loses almost nothing in size
+    return pil_image_to_bytes(generate_qr(_order), compress_level=1).getvalue()
+
+
+def qr_png_bytes(order: Order) -> bytes:
+    """Get the PNG bytes of an order's QR code, encoding it once per order contents.
+
+    Args:
+        order: Order to encode.
+
+    Returns:
+        PNG bytes of the QR code.
+    """
+    return _qr_png_bytes(order, order.model_dump_json())
+
+
+def _on_order_saved(future: Future[Any]) -> None:
+    """Refresh the saved-order list once a background save succeeds.
+
+    A failed save is ignored: the order still works locally.
+    """
+    if future.exception() is None:
+        _load_saved_orders.clear()
+
+
+def _generate_order_id() -> str:
+    """Generate a unique order ID."""
+    return f"ORD-{secrets.token_hex(5).upper()}"
+
+
+@functools.lru_cache(maxsize=128)
+def _format_items_prompt(items_key: tuple[tuple[str, int], ...]) -> str:
+    """Build the image generation prompt for a set of (item name, quantity) pairs."""
+    items_text = "\n".join(f"- {quantity}x {name}" for name, quantity in items_key)
+    return f"{_PROMPT_PREFIX}\n{items_text}\n{_PROMPT_SUFFIX}"
+
+
+def _format_order_prompt(order: Order) -> str:
+    """Format order items into a prompt for image generation."""
+    return _format_items_prompt(tuple((item.item.value, item.quantity) for item in order.items))
+
+
+def _set_items(items: list[tuple[Item, int]]) -> None:
+    """Replace the order items and discard pending edits in the items table."""
+    st.session_state.qr_generator_items = items
+    st.session_state.pop("qr_generator_items_editor", None)
+
+
+def _reset_generated_order() -> None:
+    """Clear the generated order and its outputs, starting a fresh order."""
+    _set_items([])
+    st.session_state.qr_generator_order_id = _generate_order_id()
+    for key in (
+        "generated_qr_bytes",
+        "generated_order",
+        "generated_image_output",
+        "generated_image_download",
+        "generated_image_job",
+    ):
+        st.session_state.pop(key, None)
+
+
+def _render_items_editor() -> list[tuple[Item, int]]:
+    """Render the order items as one editable table.
+
+    Rows are added, edited and removed in a single st.data_editor instead of a
+    row of widgets per item. The stored items are the table's base data; the
+    editor keeps the pending edits in its widget state.
+
+    Returns:
+        Items currently in the table, skipping incomplete rows.
+    """
+    base_items: list[tuple[Item, int]] = st.session_state.qr_generator_items
+    edited = st.data_editor(
+        pd.DataFrame(
+            {
+                "Article": [item.value for item, _ in base_items],
+                "Quantité": pd.Series([quantity for _, quantity in base_items], dtype="int64"),
+            }
+        ),
+        num_rows="dynamic",
+        hide_index=True,
+        width="stretch",
+        key="qr_generator_items_editor",
+        column_config={
+            "Article": st.column_config.SelectboxColumn(options=_ITEM_VALUES, required=True),
+            "Quantité": st.column_config.NumberColumn(min_value=1, step=1, default=1, required=True),
+        },
+    )
+    return [
+        (Item(name), int(quantity))
+        for name, quantity in zip(edited["Article"], edited["Quantité"], strict=True)
+        if pd.notna(name) and pd.notna(quantity) and quantity >= 1
+    ]
+
+
+def _warn_missing_image_key(provider_name: str) -> None:
+    """Show the missing API key warning for image generation."""
+    st.warning(
+        "⚠️ **API Key manquante** : Veuillez configurer la clé API pour Image Generation "
+        "dans la barre latérale (section ⚙️ Celeste AI config) ou définir la variable "
+        f"d'environnement pour le fournisseur {provider_name}."
+    )
+
+
+def _image_download_data(output: Any) -> bytes | io.BytesIO | None:  # noqa: ANN401
+    """Extract downloadable PNG data from an image generation output.
+
+    PIL images are encoded once into a buffer that is handed to the download
+    button as-is; raw bytes are used without copying.
+
+    Args:
+        output: Output from client.generate().
+
+    Returns:
+        Image bytes or PNG buffer, or None if the output holds no image data.
+    """
+    content = getattr(output, "content", None)
+    if isinstance(content, list):
+        content = content[0] if content else None
+    if not isinstance(content, ImageArtifact):
+        return None
+    if isinstance(content.data, Image.Image):
+        return pil_image_to_bytes(content.data)
+    if isinstance(content.data, bytes):
+        return content.data
+    return None
+
+
+@st.fragment(run_every=0.5)
+def _poll_image_generation() -> None:
+    """Poll the background image generation and publish its output when done.
+
+    Only this fragment reruns while the model is working, so the rest of the
+    page stays interactive. Once the job finishes, a full rerun renders the
+    image and its download button, or the missing API key warning.
+    """
+    job = st.session_state.get("generated_image_job")
+    if job is None:
+        return
+    future, provider_name = job
+    if not future.done():
+        st.info("🎨 Génération de l'image en cours...")
+        return
+
+    del st.session_state.generated_image_job
+    try:
+        output = future.result()
+    except MissingCredentialsError:
+        st.session_state.generated_image_missing_key = provider_name
+    else:
+        st.session_state.generated_image_output = output
+        st.session_state.generated_image_download = _image_download_data(output)
+    st.rerun()
+
+
+@st.fragment
+def _render_generated_qr_section() -> None:
+    """Render the generated QR code, its example image and download buttons.
+
+    Runs as a fragment so download and image buttons only rerun this section,
+    not the order form above it.
+    """
+    st.divider()
+    st.markdown("#### 📱 QR Code généré")
+
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col2:
+        st.image(st.session_state.generated_qr_bytes, width=300)
+
+    if "generated_order" in st.session_state:
+        render_order_details(st.session_state.generated_order)
 
-    return "\n".join(prompt_parts)
+    st.divider()
+    generate_image_clicked = st.button(
+        "🎨 Générer une image d'exemple",
+        width="stretch",
+        type="secondary",
+        help="Générer une image d'exemple de la commande avec l'IA",
+        disabled="generated_image_job" in st.session_state,
+    )
+
+    if generate_image_clicked:
+        if "generated_order" not in st.session_state:
+            st.error("⚠️ Veuillez d'abord générer un QR code")
+        else:
+            with st.spinner("🎨 Préparation de la génération..."):
+                order = st.session_state.generated_order
+                provider, model, api_key = get_client_config(
+                    Capability.IMAGE_GENERATION,
+                    default_provider="google",
+                    default_model="gemini-2.5-flash-image",
+                )
+                try:
+                    client = get_client(
+                        Capability.IMAGE_GENERATION, provider, model.id, usable_api_key(api_key)
+                    )
+                except MissingCredentialsError:
+                    _warn_missing_image_key(provider.value)
+                    st.stop()
+                prompt = _format_order_prompt(order)
+                st.session_state.generated_image_job = (
+                    runner.submit(client.generate(prompt=prompt)),
+                    provider.value,
+                )
+
+    if "generated_image_job" in st.session_state:
+        _poll_image_generation()
+    elif missing_key_provider := st.session_state.pop("generated_image_missing_key", None):
+        _warn_missing_image_key(missing_key_provider)
 
+    if "generated_image_output" in st.session_state:
+        st.divider()
+        st.markdown("#### 🎨 Image d'exemple générée")
+        col1, col2, col3 = st.columns([1, 1, 1])
+        with col2:
+            render_image_output(st.session_state.generated_image_output)
 
+    st.divider()
+    qr_img_bytes = st.session_state.generated_qr_bytes
+
+    generated_image_bytes = st.session_state.get("generated_image_download")
+
+    if generated_image_bytes:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.download_button(
+                label="💾 Télécharger QR Code",
+                data=qr_img_bytes,
+                file_name=f"qr_{st.session_state.generated_order.order_id}.png",
+                mime="image/png",
+                width="stretch",
+            )
+        with col2:
+            st.download_button(
+                label="🎨 Télécharger Image",
+                data=generated_image_bytes,
+                file_name=f"image_{st.session_state.generated_order.order_id}.png",
+                mime="image/png",
+                width="stretch",
+            )
+        with col3:
+            if st.button("➕ Créer une nouvelle commande", width="stretch", type="secondary"):
+                _reset_generated_order()
+                st.rerun()
+    else:
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button(
+                label="💾 Télécharger QR Code",
+                data=qr_img_bytes,
+                file_name=f"qr_{st.session_state.generated_order.order_id}.png",
+                mime="image/png",
+                width="stretch",
+            )
+        with col2:
+            if st.button("➕ Créer une nouvelle commande", width="stretch", type="secondary"):
+                _reset_generated_order()
+                st.rerun()
+
+
+@st.fragment
 def render_qr_generator() -> None:
     """Render QR code generator form and display."""
     st.markdown("#### 📝 Créer une commande")
 
     st.markdown("##### 📥 Charger une commande sauvegardée")
     try:
-        saved_orders = runner.run(get_all_orders(limit=50))
+        saved_orders = _load_saved_orders(50)
         if saved_orders:
-            order_options = {f"{order.order_id} ({order.source.value})": order for order in saved_orders}
+            labels = [f"{order.order_id} ({order.source.value})" for order in saved_orders]
+            orders_by_label = dict(zip(labels, saved_orders, strict=True))
             selected_order_key = st.selectbox(
                 "Sélectionner une commande",
-                options=[""] + list(order_options.keys()),
+                options=["", *labels],
                 key="load_saved_order",
             )
 
-            if selected_order_key and selected_order_key != "":
-                selected_order = order_options[selected_order_key]
+            selected_order = orders_by_label.get(selected_order_key)
+            if selected_order is not None:
                 if st.button("📱 Charger et régénérer QR", key="load_order_btn"):
-                    qr_image = generate_qr(selected_order)
-
-                    st.session_state.generated_qr = qr_image
+                    st.session_state.generated_qr_bytes = qr_png_bytes(selected_order)
                     st.session_state.generated_order = selected_order
 
                     st.session_state.qr_generator_order_id = selected_order.order_id
                     st.session_state.qr_generator_source = selected_order.source
-                    st.session_state.qr_generator_items = [
-                        (item.item, item.quantity) for item in selected_order.items
-                    ]
+                    _set_items([(item.item, item.quantity) for item in selected_order.items])
                     st.rerun()
         else:
             st.info("Aucune commande sauvegardée.")
@@ -101,66 +372,21 @@ def render_qr_generator() -> None:
     if "qr_generator_order_id" not in st.session_state:
         st.session_state.qr_generator_order_id = _generate_order_id()
 
-    default_source = (
-        st.session_state.get("qr_generator_source", OrderSource.UBER_EATS)
-        if "qr_generator_source" in st.session_state
-        else OrderSource.UBER_EATS
-    )
+    default_source = st.session_state.get("qr_generator_source", OrderSource.UBER_EATS)
     source = st.selectbox(
         "Plateforme",
-        [OrderSource.UBER_EATS, OrderSource.DELIVEROO],
-        format_func=lambda x: "UberEats" if x == OrderSource.UBER_EATS else "Deliveroo",
-        index=0 if default_source == OrderSource.UBER_EATS else 1,
+        _SOURCE_OPTIONS,
+        format_func=_SOURCE_LABELS.__getitem__,
+        index=_SOURCE_OPTIONS.index(default_source),
         key="qr_generator_source",
     )
 
     st.markdown("**Articles:**")
 
     if "qr_generator_items" not in st.session_state:
-        st.session_state.qr_generator_items = []
-
-    items = st.session_state.qr_generator_items
-
-    if items:
-        for idx, (item_enum, quantity) in enumerate(items):
-            col1, col2, col3 = st.columns([3, 1, 1])
-            with col1:
-                st.text(f"{quantity}x {item_enum.value}")
-            with col2:
-                if st.button("✏️", key=f"edit_item_{idx}", help="Modifier"):
-                    items.pop(idx)
-                    st.session_state[f"edit_item_{idx}_item"] = item_enum
-                    st.session_state[f"edit_item_{idx}_qty"] = quantity
-                    st.rerun()
-            with col3:
-                if st.button("🗑️", key=f"remove_item_{idx}", help="Supprimer"):
-                    items.pop(idx)
-                    st.rerun()
-
-    st.divider()
-    col1, col2, col3 = st.columns([3, 1, 1])
+        _set_items([])
 
-    with col1:
-        new_item = st.selectbox(
-            "Article",
-            list(Item),
-            format_func=lambda x: x.value,
-            key="qr_generator_new_item",
-        )
-
-    with col2:
-        new_quantity = st.number_input(
-            "Quantité",
-            min_value=1,
-            value=1,
-            key="qr_generator_new_quantity",
-        )
-
-    with col3:
-        st.markdown("<br>", unsafe_allow_html=True)  # Spacing
-        if st.button("➕ Ajouter", key="qr_generator_add_item", width="stretch"):
-            items.append((new_item, new_quantity))
-            st.rerun()
+    items = _render_items_editor()
 
     st.divider()
     generate_clicked = st.button(
@@ -180,153 +406,16 @@ def render_qr_generator() -> None:
             order_items = [OrderItem(item=item_enum, quantity=qty) for item_enum, qty in items]
             order = Order(order_id=order_id, source=source, items=order_items)
 
-            qr_image = generate_qr(order)
-
-            try:
-                runner.run(save_order(order))
-            except Exception:  # nosec B110
-                pass  # Silent failure - order still works locally
+            # Save in the background so the QR shows without waiting on the database
+            runner.submit(save_order(order)).add_done_callback(_on_order_saved)
 
-            st.session_state.generated_qr = qr_image
+            st.session_state.generated_qr_bytes = qr_png_bytes(order)
             st.session_state.generated_order = order
 
             st.session_state.qr_generator_order_id = _generate_order_id()
 
-    if "generated_qr" in st.session_state:
-        st.divider()
-        st.markdown("#### 📱 QR Code généré")
-
-        col1, col2, col3 = st.columns([1, 1, 1])
-        with col2:
-            img_bytes = pil_image_to_bytes(st.session_state.generated_qr)
-            st.image(img_bytes, width=300)
-
-        if "generated_order" in st.session_state:
-            render_order_details(st.session_state.generated_order)
-
-        st.divider()
-        generate_image_clicked = st.button(
-            "🎨 Générer une image d'exemple",
-            width="stretch",
-            type="secondary",
-            help="Générer une image d'exemple de la commande avec l'IA",
-        )
-
-        if generate_image_clicked:
-            if "generated_order" not in st.session_state:
-                st.error("⚠️ Veuillez d'abord générer un QR code")
-            else:
-                with st.spinner("🎨 Génération de l'image en cours..."):
-                    order = st.session_state.generated_order
-                    provider, model, api_key = get_client_config(
-                        Capability.IMAGE_GENERATION,
-                        default_provider="google",
-                        default_model="gemini-2.5-flash-image",
-                    )
-                    client_kwargs: dict[str, Any] = {
-                        "capability": Capability.IMAGE_GENERATION,
-                        "provider": provider,
-                        "model": model.id,
-                    }
-                    # Only add api_key if it's provided and non-empty (empty SecretStr prevents env var fallback)
-                    if api_key is not None:
-                        api_key_value = api_key.get_secret_value()
-                        if api_key_value and api_key_value.strip():
-                            client_kwargs["api_key"] = api_key
-
-                    try:
-                        client = create_client(**client_kwargs)
-                        prompt = _format_order_prompt(order)
-                        output = runner.run(client.generate(prompt=prompt))
-                        st.session_state.generated_image_output = output
-                    except MissingCredentialsError:
-                        st.warning(
-                            "⚠️ **API Key manquante** : Veuillez configurer la clé API pour Image Generation "
-                            "dans la barre latérale (section ⚙️ Celeste AI config) ou définir la variable "
-                            f"d'environnement pour le fournisseur {provider.value}."
-                        )
-                        st.stop()
-
-        if "generated_image_output" in st.session_state:
-            st.divider()
-            st.markdown("#### 🎨 Image d'exemple générée")
-            col1, col2, col3 = st.columns([1, 1, 1])
-            with col2:
-                render_image_output(st.session_state.generated_image_output)
-
-        st.divider()
-        qr_img_bytes = pil_image_to_bytes(st.session_state.generated_qr)
-
-        generated_image_bytes: bytes | None = None
-        if "generated_image_output" in st.session_state:
-            generated_output: Any = st.session_state.generated_image_output
-            artifact: ImageArtifact | None = None
-
-            if hasattr(generated_output, "content"):
-                content = generated_output.content
-                if isinstance(content, ImageArtifact):
-                    artifact = content
-                elif isinstance(content, list) and content:
-                    artifact = content[0] if isinstance(content[0], ImageArtifact) else None
-
-            if artifact:
-                if artifact.data is not None:
-                    if isinstance(artifact.data, Image.Image):
-                        img_buffer = pil_image_to_bytes(artifact.data)
-                        generated_image_bytes = img_buffer.getvalue()
-                    elif isinstance(artifact.data, bytes):
-                        generated_image_bytes = artifact.data
-
-        if generated_image_bytes:
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.download_button(
-                    label="💾 Télécharger QR Code",
-                    data=qr_img_bytes,
-                    file_name=f"qr_{st.session_state.generated_order.order_id}.png",
-                    mime="image/png",
-                    width="stretch",
-                )
-            with col2:
-                st.download_button(
-                    label="🎨 Télécharger Image",
-                    data=generated_image_bytes,
-                    file_name=f"image_{st.session_state.generated_order.order_id}.png",
-                    mime="image/png",
-                    width="stretch",
-                )
-            with col3:
-                if st.button("➕ Créer une nouvelle commande", width="stretch", type="secondary"):
-                    st.session_state.qr_generator_items = []
-                    st.session_state.qr_generator_order_id = _generate_order_id()
-                    if "generated_qr" in st.session_state:
-                        del st.session_state.generated_qr
-                    if "generated_order" in st.session_state:
-                        del st.session_state.generated_order
-                    if "generated_image_output" in st.session_state:
-                        del st.session_state.generated_image_output
-                    st.rerun()
-        else:
-            col1, col2 = st.columns(2)
-            with col1:
-                st.download_button(
-                    label="💾 Télécharger QR Code",
-                    data=qr_img_bytes,
-                    file_name=f"qr_{st.session_state.generated_order.order_id}.png",
-                    mime="image/png",
-                    width="stretch",
-                )
-            with col2:
-                if st.button("➕ Créer une nouvelle commande", width="stretch", type="secondary"):
-                    st.session_state.qr_generator_items = []
-                    st.session_state.qr_generator_order_id = _generate_order_id()
-                    if "generated_qr" in st.session_state:
-                        del st.session_state.generated_qr
-                    if "generated_order" in st.session_state:
-                        del st.session_state.generated_order
-                    if "generated_image_output" in st.session_state:
-                        del st.session_state.generated_image_output
-                    st.rerun()
+    if "generated_qr_bytes" in st.session_state:
+        _render_generated_qr_section()
 
 
-__all__ = ["render_qr_generator"]
+__all__ = ["qr_png_bytes", "render_qr_generator"]
@@ -6,6 +6,21 @@ from PIL import Image
 from staff_meal.models import Order
 from ui.components.input import render_image_input
 from ui.services import read_qr_order
+from ui.utils.image import image_fingerprint
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _read_qr_order_cached(_qr_image: Image.Image, image_key: str) -> Order:
+    """Decode the order in a QR image, cached on the image contents.
+
+    Args:
+        _qr_image: QR code image (not hashed by st.cache_data).
+        image_key: Content fingerprint of the image.
+
+    Returns:
+        Order parsed from the QR code.
+    """
+    return read_qr_order(_qr_image)
 
 
 def render_qr_input_section(
@@ -60,7 +75,7 @@ def render_qr_input_section(
         else:
             with st.spinner("🔍 Lecture du QR code..."):
                 try:
-                    order = read_qr_order(qr_image)
+                    order = _read_qr_order_cached(qr_image, image_fingerprint(qr_image))
                 except ValueError as e:
                     error_message = str(e)
 
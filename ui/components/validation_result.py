@@ -1,20 +1,141 @@
 """Validation result display component - shows order validation results."""
 
 import re
+import urllib.request
 
 import streamlit as st
 
 from celeste.artifacts import AudioArtifact
+from celeste.core import Capability, Provider
 from celeste.exceptions import MissingCredentialsError
 from celeste.mime_types import AudioMimeType
+from pydantic import SecretStr
 
 from staff_meal.models import ComparisonResult, Language, Order
+from ui.services.client_config import api_key_digest, get_client_config, usable_api_key
 from ui.services.explanation import (
-    generate_validation_explanation,
-    generate_validation_explanation_audio,
+    generate_validation_explanation_async,
+    submit_validation_explanation_audio,
 )
+from ui.utils import runner
 from ui.utils.audio import pcm_to_wav
 
+# Languages offered for the explanation, in selectbox order, and their display names
+_ALL_LANGUAGES: list[Language] = [
+    Language.FRENCH,
+    Language.ENGLISH,
+    Language.SPANISH,
+    Language.ARABIC,
+    Language.WOLOF,
+    Language.BAMBARA,
+    Language.MANDARIN_CHINESE,
+    Language.VIETNAMESE,
+    Language.PORTUGUESE,
+    Language.ROMANIAN,
+    Language.BERBER_TAMAZIGHT,
+    Language.LINGALA,
+    Language.SWAHILI,
+    Language.CANTONESE,
+    Language.TURKISH,
+    Language.ITALIAN,
+    Language.POLISH,
+    Language.HINDI,
+    Language.FULA_FULANI,
+    Language.HAUSA,
+    Language.KHMER,
+    Language.URDU,
+    Language.BENGALI,
+    Language.TAGALOG,
+    Language.TAMIL,
+]
+
+_LANGUAGE_DISPLAY_NAMES: dict[Language, str] = {
+    Language.FRENCH: "🇫🇷 Français",
+    Language.ENGLISH: "🇬🇧 English",
+    Language.SPANISH: "🇪🇸 Español",
+    Language.ARABIC: "🇸🇦 العربية",
+    Language.WOLOF: "🇸🇳 Wolof",
+    Language.BAMBARA: "🇲🇱 Bambara",
+    Language.MANDARIN_CHINESE: "🇨🇳 中文 (Mandarin)",
+    Language.VIETNAMESE: "🇻🇳 Tiếng Việt",
+    Language.PORTUGUESE: "🇵🇹 Português",
+    Language.ROMANIAN: "🇷🇴 Română",
+    Language.BERBER_TAMAZIGHT: "ⵣ Tamazight",
+    Language.LINGALA: "🇨🇩 Lingála",
+    Language.SWAHILI: "🇹🇿 Kiswahili",
+    Language.CANTONESE: "🇭🇰 粵語 (Cantonese)",
+    Language.TURKISH: "🇹🇷 Türkçe",
+    Language.ITALIAN: "🇮🇹 Italiano",
+    Language.POLISH: "🇵🇱 Polski",
+    Language.HINDI: "🇮🇳 हिन्दी",
+    Language.FULA_FULANI: "🇬🇳 Fulfulde",
+    Language.HAUSA: "🇳🇬 Hausa",
+    Language.KHMER: "🇰🇭 ភាសាខ្មែរ",
+    Language.URDU: "🇵🇰 اردو",
+    Language.BENGALI: "🇧🇩 বাংলা",
+    Language.TAGALOG: "🇵🇭 Tagalog",
+    Language.TAMIL: "🇮🇳 தமிழ்",
+}
+
+# Quoted item names in the explanation are highlighted in bold
+_QUOTED_PATTERN = re.compile(r'"([^"]+)"')
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _explanation_cached(
+    _expected_order: Order,
+    _detected_order: Order,
+    language: Language,
+    expected_key: str,
+    detected_key: str,
+    provider: Provider,
+    model_id: str,
+    key_digest: str,
+    _api_key: SecretStr | None,
+) -> str:
+    """Generate the validation explanation, cached on both orders, the language and the client config.
+
+    The provider, model and API key digest are part of the key so sessions
+    with a different sidebar config never share an explanation.
+
+    Args:
+        _expected_order: Expected order from QR code (not hashed).
+        _detected_order: Detected order from bag image (not hashed).
+        language: Language for the explanation.
+        expected_key: JSON dump of the expected order.
+        detected_key: JSON dump of the detected order.
+        provider: Text generation provider.
+        model_id: Text generation model ID.
+        key_digest: Digest of the API key, empty when falling back to env vars.
+        _api_key: API key from the sidebar (not hashed).
+
+    Returns:
+        Generated explanation text.
+    """
+    return runner.run(  # type: ignore[no-any-return]
+        generate_validation_explanation_async(
+            _expected_order,
+            _detected_order,
+            language,
+            provider=provider,
+            model_id=model_id,
+            api_key=_api_key,
+        )
+    )
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _pcm_to_wav_cached(pcm_bytes: bytes, sample_rate: int, channels: int, sample_width: int) -> bytes:
+    """Wrap raw PCM audio in a WAV container, cached across reruns."""
+    return pcm_to_wav(pcm_bytes, sample_rate=sample_rate, channels=channels, sample_width=sample_width)
+
+
+@st.cache_data(ttl=600, max_entries=64, show_spinner=False)
+def _fetch_audio_url(url: str) -> bytes:
+    """Download remote audio once per URL instead of on every rerun."""
+    with urllib.request.urlopen(url) as response:  # nosec B310
+        return response.read()  # type: ignore[no-any-return]
+
 
 def render_validation_result(
     is_complete: bool,
@@ -41,72 +162,34 @@ def render_validation_result(
         with col1:
             st.markdown("**💬 Explication:**")
         with col2:
-            all_languages = [
-                Language.FRENCH,
-                Language.ENGLISH,
-                Language.SPANISH,
-                Language.ARABIC,
-                Language.WOLOF,
-                Language.BAMBARA,
-                Language.MANDARIN_CHINESE,
-                Language.VIETNAMESE,
-                Language.PORTUGUESE,
-                Language.ROMANIAN,
-                Language.BERBER_TAMAZIGHT,
-                Language.LINGALA,
-                Language.SWAHILI,
-                Language.CANTONESE,
-                Language.TURKISH,
-                Language.ITALIAN,
-                Language.POLISH,
-                Language.HINDI,
-                Language.FULA_FULANI,
-                Language.HAUSA,
-                Language.KHMER,
-                Language.URDU,
-                Language.BENGALI,
-                Language.TAGALOG,
-                Language.TAMIL,
-            ]
-
-            language_display_names = {
-                Language.FRENCH: "🇫🇷 Français",
-                Language.ENGLISH: "🇬🇧 English",
-                Language.SPANISH: "🇪🇸 Español",
-                Language.ARABIC: "🇸🇦 العربية",
-                Language.WOLOF: "🇸🇳 Wolof",
-                Language.BAMBARA: "🇲🇱 Bambara",
-                Language.MANDARIN_CHINESE: "🇨🇳 中文 (Mandarin)",
-                Language.VIETNAMESE: "🇻🇳 Tiếng Việt",
-                Language.PORTUGUESE: "🇵🇹 Português",
-                Language.ROMANIAN: "🇷🇴 Română",
-                Language.BERBER_TAMAZIGHT: "ⵣ Tamazight",
-                Language.LINGALA: "🇨🇩 Lingála",
-                Language.SWAHILI: "🇹🇿 Kiswahili",
-                Language.CANTONESE: "🇭🇰 粵語 (Cantonese)",
-                Language.TURKISH: "🇹🇷 Türkçe",
-                Language.ITALIAN: "🇮🇹 Italiano",
-                Language.POLISH: "🇵🇱 Polski",
-                Language.HINDI: "🇮🇳 हिन्दी",
-                Language.FULA_FULANI: "🇬🇳 Fulfulde",
-                Language.HAUSA: "🇳🇬 Hausa",
-                Language.KHMER: "🇰🇭 ភាសាខ្មែរ",
-                Language.URDU: "🇵🇰 اردو",
-                Language.BENGALI: "🇧🇩 বাংলা",
-                Language.TAGALOG: "🇵🇭 Tagalog",
-                Language.TAMIL: "🇮🇳 தமிழ்",
-            }
-
             language = st.selectbox(
                 "Langue",
-                options=all_languages,
-                format_func=lambda x: language_display_names.get(x, x.value),
+                options=_ALL_LANGUAGES,
+                format_func=_LANGUAGE_DISPLAY_NAMES.__getitem__,
                 index=0,
                 key="explanation_language",
             )
         try:
+            explanation_ready = False
             try:
-                explanation = generate_validation_explanation(expected_order, detected_order, language)
+                provider, model, api_key = get_client_config(
+                    Capability.TEXT_GENERATION,
+                    default_provider="google",
+                    default_model="gemini-2.5-flash-lite",
+                )
+                api_key = usable_api_key(api_key)
+                explanation = _explanation_cached(
+                    expected_order,
+                    detected_order,
+                    language,
+                    expected_order.model_dump_json(),
+                    detected_order.model_dump_json(),
+                    provider,
+                    model.id,
+                    api_key_digest(api_key),
+                    api_key,
+                )
+                explanation_ready = True
             except MissingCredentialsError:
                 st.warning(
                     "⚠️ **API Key manquante** : Veuillez configurer la clé API pour Text Generation "
@@ -114,26 +197,31 @@ def render_validation_result(
                     "d'environnement pour le fournisseur."
                 )
                 explanation = "Configuration de l'API requise pour générer l'explication."
-            formatted_explanation = re.sub(
-                r'"([^"]+)"',
+            formatted_explanation = _QUOTED_PATTERN.sub(
                 r'<strong style="color: #1976d2; font-weight: 600;">\1</strong>',
                 explanation,
             )
             st.markdown(
-                '<div style="background-color: #f8f9fa; padding: 24px; border-radius: 8px; margin: 15px 0; border: 1px solid #e0e0e0;">',
-                unsafe_allow_html=True,
-            )
-            st.markdown(
-                f'<div style="margin: 0; font-size: 20px; line-height: 1.8; color: #212529;">{formatted_explanation}</div>',
+                '<div style="background-color: #f8f9fa; padding: 24px; border-radius: 8px; margin: 15px 0; border: 1px solid #e0e0e0;">'
+                f'<div style="margin: 0; font-size: 20px; line-height: 1.8; color: #212529;">{formatted_explanation}</div>'
+                "</div>",
                 unsafe_allow_html=True,
             )
-            st.markdown("</div>", unsafe_allow_html=True)
 
             audio_key = f"audio_{expected_order.order_id}_{detected_order.order_id}_{language.value}"
 
+            audio_future_key = f"audio_future_{audio_key}"
+
             if audio_key not in st.session_state:
                 st.session_state[audio_key] = None
 
+            # Start speech generation now so the audio is usually ready by the time it is requested
+            if explanation_ready and st.session_state[audio_key] is None and audio_future_key not in st.session_state:
+                try:
+                    st.session_state[audio_future_key] = submit_validation_explanation_audio(explanation, language)
+                except Exception:  # nosec B110
+                    pass  # The button falls back to generating on demand
+
             col1, col2 = st.columns([1, 3])
             with col1:
                 generate_audio_clicked = st.button(
@@ -147,7 +235,10 @@ def render_validation_result(
                     try:
                         with st.spinner("🔊 Génération de l'audio..."):
                             try:
-                                audio_content = generate_validation_explanation_audio(explanation, language)
+                                audio_future = st.session_state.pop(audio_future_key, None)
+                                if audio_future is None:
+                                    audio_future = submit_validation_explanation_audio(explanation, language)
+                                audio_content = audio_future.result()
                                 st.session_state[audio_key] = audio_content
                             except MissingCredentialsError:
                                 st.warning(
@@ -173,14 +264,12 @@ def render_validation_result(
                             else:
                                 audio_bytes = None
                         elif hasattr(audio_content, "url") and audio_content.url:
-                            import urllib.request
-                            with urllib.request.urlopen(audio_content.url) as response:  # nosec B310
-                                audio_bytes = response.read()
+                            audio_bytes = _fetch_audio_url(audio_content.url)
 
                         if audio_bytes and hasattr(audio_content, "mime_type"):
                             if audio_content.mime_type == AudioMimeType.PCM:
                                 metadata = getattr(audio_content, "metadata", {}) or {}
-                                audio_bytes = pcm_to_wav(
+                                audio_bytes = _pcm_to_wav_cached(
                                     audio_bytes,
                                     sample_rate=metadata.get("sample_rate", 24000),
                                     channels=metadata.get("channels", 1),
@@ -196,22 +285,13 @@ def render_validation_result(
 
     if is_complete:
         st.markdown(
-            '<div style="text-align: center; background-color: #e8f5e9; padding: 30px; border-radius: 10px; margin: 20px 0;">',
-            unsafe_allow_html=True,
-        )
-        st.markdown(
-            '<div style="text-align: center; font-size: 64px; color: #2e7d32; margin: 10px 0;">✅</div>',
-            unsafe_allow_html=True,
-        )
-        st.markdown(
-            '<div style="text-align: center; font-size: 36px; font-weight: bold; color: #2e7d32; margin: 10px 0;">VALIDÉ</div>',
+            '<div style="text-align: center; background-color: #e8f5e9; padding: 30px; border-radius: 10px; margin: 20px 0;">'
+            '<div style="text-align: center; font-size: 64px; color: #2e7d32; margin: 10px 0;">✅</div>'
+            '<div style="text-align: center; font-size: 36px; font-weight: bold; color: #2e7d32; margin: 10px 0;">VALIDÉ</div>'
+            '<div style="text-align: center; font-size: 20px; color: #2e7d32; margin: 10px 0;">Tout est correct. Vous pouvez fermer le sac.</div>'
+            "</div>",
             unsafe_allow_html=True,
         )
-        st.markdown(
-            '<div style="text-align: center; font-size: 20px; color: #2e7d32; margin: 10px 0;">Tout est correct. Vous pouvez fermer le sac.</div>',
-            unsafe_allow_html=True,
-        )
-        st.markdown("</div>", unsafe_allow_html=True)
     else:
         error_count = (
             len(comparison_result.missing_items)
@@ -220,58 +300,47 @@ def render_validation_result(
             + len(comparison_result.extra_items)
         )
         st.markdown(
-            '<div style="text-align: center; background-color: #ffebee; padding: 20px; border-radius: 10px; margin: 20px 0;">',
-            unsafe_allow_html=True,
-        )
-        st.markdown(
-            '<div style="text-align: center; font-size: 64px; color: #c62828; margin: 10px 0;">❌</div>',
-            unsafe_allow_html=True,
-        )
-        st.markdown(
-            '<div style="text-align: center; font-size: 36px; font-weight: bold; color: #c62828; margin: 10px 0;">ERREUR</div>',
-            unsafe_allow_html=True,
-        )
-        st.markdown(
-            f'<div style="text-align: center; font-size: 18px; color: #c62828; margin: 10px 0;">{error_count} erreur(s) détectée(s)</div>',
+            '<div style="text-align: center; background-color: #ffebee; padding: 20px; border-radius: 10px; margin: 20px 0;">'
+            '<div style="text-align: center; font-size: 64px; color: #c62828; margin: 10px 0;">❌</div>'
+            '<div style="text-align: center; font-size: 36px; font-weight: bold; color: #c62828; margin: 10px 0;">ERREUR</div>'
+            f'<div style="text-align: center; font-size: 18px; color: #c62828; margin: 10px 0;">{error_count} erreur(s) détectée(s)</div>'
+            "</div>",
             unsafe_allow_html=True,
         )
-        st.markdown("</div>", unsafe_allow_html=True)
 
     if not is_complete:
         st.markdown("<br>", unsafe_allow_html=True)
-        with st.expander("🔍 Détails des erreurs", expanded=True):
-            if comparison_result.missing_items:
-                missing_list = ", ".join(
-                    [
-                        f"{item.item.value} ({item.expected_quantity}x)"
-                        for item in comparison_result.missing_items
-                    ]
-                )
-                st.markdown(f"**❌ Articles manquants:** {missing_list}")
-
-            if comparison_result.too_few_items:
-                too_few_list = ", ".join(
-                    [
-                        f"{item.item.value} (attendu: {item.expected_quantity}x, détecté: {item.detected_quantity}x)"
-                        for item in comparison_result.too_few_items
-                    ]
-                )
-                st.markdown(f"**⚠️ Quantités insuffisantes:** {too_few_list}")
-
-            if comparison_result.too_many_items:
-                too_many_list = ", ".join(
-                    [
-                        f"{item.item.value} (attendu: {item.expected_quantity}x, détecté: {item.detected_quantity}x)"
-                        for item in comparison_result.too_many_items
-                    ]
-                )
-                st.markdown(f"**⚠️ Quantités excessives:** {too_many_list}")
+        details: list[str] = []
+        if comparison_result.missing_items:
+            missing_list = ", ".join(
+                f"{item.item.value} ({item.expected_quantity}x)"
+                for item in comparison_result.missing_items
+            )
+            details.append(f"**❌ Articles manquants:** {missing_list}")
 
-            if comparison_result.extra_items:
-                extra_list = ", ".join(
-                    [f"{item.item.value} ({item.quantity}x)" for item in comparison_result.extra_items]
-                )
-                st.markdown(f"**➕ Articles supplémentaires:** {extra_list}")
+        if comparison_result.too_few_items:
+            too_few_list = ", ".join(
+                f"{item.item.value} (attendu: {item.expected_quantity}x, détecté: {item.detected_quantity}x)"
+                for item in comparison_result.too_few_items
+            )
+            details.append(f"**⚠️ Quantités insuffisantes:** {too_few_list}")
+
+        if comparison_result.too_many_items:
+            too_many_list = ", ".join(
+                f"{item.item.value} (attendu: {item.expected_quantity}x, détecté: {item.detected_quantity}x)"
+                for item in comparison_result.too_many_items
+            )
+            details.append(f"**⚠️ Quantités excessives:** {too_many_list}")
+
+        if comparison_result.extra_items:
+            extra_list = ", ".join(
+                f"{item.item.value} ({item.quantity}x)" for item in comparison_result.extra_items
+            )
+            details.append(f"**➕ Articles supplémentaires:** {extra_list}")
+
+        with st.expander("🔍 Détails des erreurs", expanded=True):
+            # One element for all sections; blank lines keep them as separate paragraphs
+            st.markdown("\n\n".join(details))
 
 
 __all__ = ["render_validation_result"]
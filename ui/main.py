@@ -8,6 +8,14 @@ from ui.components.order_list import render_order_list
 from ui.components.order_validator import render_order_validator
 from ui.components.qr_generator import render_qr_generator
 
+# Navigation pages, in sidebar order, and their labels
+_PAGE_LABELS = {
+    "validation": "✅ Validation",
+    "dashboard": "📊 Tableau de bord",
+    "demo": "📝 Mode démo",
+    "orders": "📋 Commandes sauvegardées",
+}
+
 
 def render() -> None:
     """Main render function - orchestrates the entire UI."""
@@ -18,25 +26,17 @@ def render() -> None:
         page_icon="🍽️",
     )
 
-    # Initialize navigation state
-    if "page" not in st.session_state:
-        st.session_state.page = "validation"
-
     # Sidebar - Navigation
     with st.sidebar:
         st.markdown("### 🧭 Navigation")
-        if st.button("✅ Validation", width="stretch", type="primary" if st.session_state.page == "validation" else "secondary"):
-            st.session_state.page = "validation"
-            st.rerun()
-        if st.button("📊 Tableau de bord", width="stretch", type="primary" if st.session_state.page == "dashboard" else "secondary"):
-            st.session_state.page = "dashboard"
-            st.rerun()
-        if st.button("📝 Mode démo", width="stretch", type="primary" if st.session_state.page == "demo" else "secondary"):
-            st.session_state.page = "demo"
-            st.rerun()
-        if st.button("📋 Commandes sauvegardées", width="stretch", type="primary" if st.session_state.page == "orders" else "secondary"):
-            st.session_state.page = "orders"
-            st.rerun()
+        # The widget key keeps the selected page in st.session_state.page
+        page = st.radio(
+            "Navigation",
+            options=tuple(_PAGE_LABELS),
+            format_func=_PAGE_LABELS.__getitem__,
+            key="page",
+            label_visibility="collapsed",
+        )
 
         st.divider()
 
@@ -50,11 +50,11 @@ def render() -> None:
     )
 
     # Main content routing
-    if st.session_state.page == "dashboard":
+    if page == "dashboard":
         render_dashboard()
-    elif st.session_state.page == "demo":
+    elif page == "demo":
         render_qr_generator()
-    elif st.session_state.page == "orders":
+    elif page == "orders":
         render_order_list()
     else:  # validation (default)
         st.markdown(
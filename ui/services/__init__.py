@@ -1,15 +1,13 @@
 """Service layer for Celeste Staff Meal UI - QR code operations."""
 
 import io
-import tempfile
-from pathlib import Path
 
 from PIL import Image
 
 from staff_meal.models import Order
 from staff_meal.qr import decode_qr
 from ui.services.explanation import generate_validation_explanation
-from ui.services.prediction import predict_order
+from ui.services.prediction import predict_order, warm_up_prediction_client
 from ui.services.validation import compare_orders
 
 
@@ -29,28 +27,24 @@ def read_qr_order(qr_image: Image.Image | bytes | None) -> Order:
         msg = "QR code non reconnu"
         raise ValueError(msg)
 
-    # Save QR image to temp file for decoding
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-        qr_path = tmp.name
-        if isinstance(qr_image, Image.Image):
-            qr_image.save(qr_path)
-        elif isinstance(qr_image, bytes):
-            img = Image.open(io.BytesIO(qr_image))
-            img.save(qr_path)
-        else:
-            msg = f"QR code non reconnu: type {type(qr_image)} non supporté"
-            raise ValueError(msg)
+    if isinstance(qr_image, bytes):
+        qr_image = Image.open(io.BytesIO(qr_image))
+    elif not isinstance(qr_image, Image.Image):
+        msg = f"QR code non reconnu: type {type(qr_image)} non supporté"
+        raise ValueError(msg)
 
     try:
-        # Decode QR code to get order
-        order = decode_qr(qr_path)
-        return order
+        # Decode QR code to get order, straight from memory
+        return decode_qr(qr_image)
     except (ValueError, KeyError, TypeError) as e:
         msg = "QR code non reconnu"
         raise ValueError(msg) from e
-    finally:
-        # Clean up temp file
-        Path(qr_path).unlink(missing_ok=True)
 
 
-__all__ = ["read_qr_order", "predict_order", "compare_orders", "generate_validation_explanation"]
+__all__ = [
+    "read_qr_order",
+    "predict_order",
+    "compare_orders",
+    "generate_validation_explanation",
+    "warm_up_prediction_client",
+]
@@ -1,5 +1,7 @@
 """Alert system for dashboard - detect anomalies and threshold breaches."""
 
+import heapq
+
 from pydantic import BaseModel, Field
 
 from staff_meal.models import Statistics, ValidationRecord
@@ -61,11 +63,13 @@ def detect_alerts(
 
     # Alert: Spike in errors (compare last 7 days vs previous 7 days)
     if len(records) >= 14:
-        recent_records = sorted(records, key=lambda r: r.timestamp, reverse=True)[:7]
-        older_records = sorted(records, key=lambda r: r.timestamp, reverse=True)[7:14]
+        # Only the 14 newest records matter, so select them without sorting everything
+        latest_records = heapq.nlargest(14, records, key=lambda r: r.timestamp)
+        recent_records = latest_records[:7]
+        older_records = latest_records[7:]
 
-        recent_errors = sum(1 for r in recent_records if not r.is_complete)
-        older_errors = sum(1 for r in older_records if not r.is_complete)
+        recent_errors = sum(not r.is_complete for r in recent_records)
+        older_errors = sum(not r.is_complete for r in older_records)
 
         if older_errors > 0:
             error_increase = ((recent_errors - older_errors) / older_errors * 100) if older_errors > 0 else 0.0
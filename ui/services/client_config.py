@@ -1,10 +1,116 @@
 """Client configuration service - model selection and API key management."""
 
-from celeste import Model, list_models
+import functools
+import hashlib
+from typing import Any
+
+import streamlit as st
+from celeste import Model, create_client, list_models
 from celeste.core import Capability, Provider
 from pydantic import SecretStr
 
 
+@functools.lru_cache(maxsize=64)
+def _resolve_models(capability: Capability, provider: Provider) -> tuple[Provider, tuple[Model, ...]]:
+    """Resolve the models available for a capability and provider.
+
+    The model registry does not change at runtime, so the lookup is cached
+    instead of scanning the registry on every rerun.
+
+    Args:
+        capability: The capability to get models for.
+        provider: Preferred provider.
+
+    Returns:
+        Tuple of (provider, models), falling back to the first provider with models.
+
+    Raises:
+        ValueError: If no provider offers the capability.
+    """
+    models = list_models(capability=capability, provider=provider)
+    if not models:
+        # Fallback to any provider
+        all_models = list_models(capability=capability)
+        if all_models:
+            provider = all_models[0].provider
+            models = [m for m in all_models if m.provider == provider]
+        else:
+            msg = f"No models found for capability {capability.value}"
+            raise ValueError(msg)
+    return provider, tuple(models)
+
+
+def api_key_digest(api_key: SecretStr | None) -> str:
+    """Digest an API key so caches can be keyed on it without holding the secret.
+
+    Args:
+        api_key: API key override, or None.
+
+    Returns:
+        SHA-256 hex digest of the key, or an empty string when there is no key.
+    """
+    if api_key is None:
+        return ""
+    return hashlib.sha256(api_key.get_secret_value().encode()).hexdigest()
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _create_client_cached(
+    capability: Capability,
+    provider: Provider | None,
+    model_id: str | None,
+    key_digest: str,
+    _api_key: SecretStr | None,
+) -> Any:  # noqa: ANN401
+    """Create a Celeste client, cached on the key digest rather than the key itself."""
+    client_kwargs: dict[str, Any] = {
+        "capability": capability,
+        "provider": provider,
+        "model": model_id,
+    }
+    if _api_key is not None:
+        client_kwargs["api_key"] = _api_key
+    return create_client(**client_kwargs)
+
+
+def get_client(
+    capability: Capability,
+    provider: Provider | None,
+    model_id: str | None,
+    api_key: SecretStr | None,
+) -> Any:  # noqa: ANN401
+    """Get a Celeste client, created once per capability, provider, model and API key.
+
+    Reusing the client keeps provider setup and credential resolution off the
+    request path after the first call. The cache is keyed on a digest of the
+    API key, so the secret itself is never part of a cache key.
+
+    Args:
+        capability: Capability the client is created for.
+        provider: Provider to use, or None for Celeste's default.
+        model_id: Model identifier, or None for Celeste's default.
+        api_key: API key override, or None to fall back to environment variables.
+
+    Returns:
+        Celeste client for the capability.
+    """
+    return _create_client_cached(capability, provider, model_id, api_key_digest(api_key), api_key)
+
+
+def usable_api_key(api_key: SecretStr | None) -> SecretStr | None:
+    """Drop empty API keys (an empty SecretStr prevents the env var fallback).
+
+    Args:
+        api_key: API key override, possibly empty.
+
+    Returns:
+        The API key, or None when it is missing or blank.
+    """
+    if api_key is not None and api_key.get_secret_value().strip():
+        return api_key
+    return None
+
+
 def get_client_config(
     capability: Capability,
     default_provider: Provider | str = "google",
@@ -20,8 +126,6 @@ def get_client_config(
     Returns:
         Tuple of (provider, model, api_key).
     """
-    import streamlit as st
-
     # Get capability key for session state
     cap_key = capability.value.replace("-", "_")
 
@@ -33,16 +137,7 @@ def get_client_config(
         provider = provider_name
 
     # Get models for this capability and provider
-    models = list_models(capability=capability, provider=provider)
-    if not models:
-        # Fallback to any provider
-        all_models = list_models(capability=capability)
-        if all_models:
-            provider = all_models[0].provider
-            models = [m for m in all_models if m.provider == provider]
-        else:
-            msg = f"No models found for capability {capability.value}"
-            raise ValueError(msg)
+    provider, models = _resolve_models(capability, provider)
 
     # Get model from session state or use default
     model_id = st.session_state.get(f"{cap_key}_model", default_model)
@@ -75,4 +170,4 @@ def get_client_config(
     return provider, model, api_key
 
 
-__all__ = ["get_client_config"]
+__all__ = ["api_key_digest", "get_client", "get_client_config", "usable_api_key"]
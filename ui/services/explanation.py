@@ -1,14 +1,16 @@
 """Service layer for generating AI explanations of validation results."""
 
+from collections.abc import AsyncGenerator, Iterator
+from concurrent.futures import Future
 from typing import Any
 
 from pydantic import SecretStr
 
-from celeste import create_client
 from celeste.artifacts import AudioArtifact
 from celeste.core import Capability, Provider
+from celeste.exceptions import StreamingNotSupportedError
 from staff_meal.models import Language, Order, Statistics, ValidationRecord
-from ui.services.client_config import get_client_config
+from ui.services.client_config import get_client, get_client_config, usable_api_key
 
 
 async def generate_validation_explanation_async(
@@ -35,18 +37,7 @@ async def generate_validation_explanation_async(
     Raises:
         ValueError: If explanation generation fails.
     """
-    client_kwargs: dict[str, Any] = {
-        "capability": Capability.TEXT_GENERATION,
-        "provider": provider,
-        "model": model_id,
-    }
-    # Only add api_key if it's provided and non-empty (empty SecretStr prevents env var fallback)
-    if api_key is not None:
-        api_key_value = api_key.get_secret_value()
-        if api_key_value and api_key_value.strip():
-            client_kwargs["api_key"] = api_key
-
-    client = create_client(**client_kwargs)
+    client = get_client(Capability.TEXT_GENERATION, provider, model_id, usable_api_key(api_key))
 
     expected_dict = expected_order.model_dump()
     detected_dict = detected_order.model_dump()
@@ -115,44 +106,8 @@ def generate_validation_explanation(
     )  # type: ignore[no-any-return]
 
 
-async def generate_dashboard_insights(
-    stats: Statistics,
-    records: list[ValidationRecord],
-    provider: Provider | None = None,
-    model_id: str | None = None,
-    api_key: SecretStr | None = None,
-) -> str:
-    """Generate AI-powered insights and recommendations for dashboard.
-
-    Args:
-        stats: Calculated statistics from validation records.
-        records: List of validation records for analysis.
-        provider: Provider to use (passed from sync function where session state is available).
-        model_id: Model ID to use (passed from sync function where session state is available).
-        api_key: API key override (passed from sync function where session state is available).
-
-    Returns:
-        Generated insights text in French with recommendations.
-
-    Raises:
-        ValueError: If insight generation fails.
-    """
-    if not records:
-        return "📊 Aucune donnée disponible pour générer des recommandations."
-
-    client_kwargs: dict[str, Any] = {
-        "capability": Capability.TEXT_GENERATION,
-        "provider": provider,
-        "model": model_id,
-    }
-    # Only add api_key if it's provided and non-empty (empty SecretStr prevents env var fallback)
-    if api_key is not None:
-        api_key_value = api_key.get_secret_value()
-        if api_key_value and api_key_value.strip():
-            client_kwargs["api_key"] = api_key
-
-    client = create_client(**client_kwargs)
-
+def _build_insights_prompt(stats: Statistics, records: list[ValidationRecord]) -> str:
+    """Build the dashboard recommendations prompt from statistics and records."""
     total_errors = stats.total_orders - stats.complete_orders
     most_forgotten_str = ""
     if stats.most_forgotten_items:
@@ -171,14 +126,19 @@ async def generate_dashboard_insights(
         if max_day_errors > 0:
             peak_days = [day for day, count in stats.errors_by_day.items() if count == max_day_errors]
 
-    missing_count = sum(len(r.comparison_result.missing_items) for r in records if not r.is_complete)
-    too_few_count = sum(len(r.comparison_result.too_few_items) for r in records if not r.is_complete)
-    too_many_count = sum(len(r.comparison_result.too_many_items) for r in records if not r.is_complete)
-    extra_count = sum(len(r.comparison_result.extra_items) for r in records if not r.is_complete)
+    missing_count = too_few_count = too_many_count = extra_count = 0
+    for record in records:
+        if record.is_complete:
+            continue
+        result = record.comparison_result
+        missing_count += len(result.missing_items)
+        too_few_count += len(result.too_few_items)
+        too_many_count += len(result.too_many_items)
+        extra_count += len(result.extra_items)
 
     error_severity = "🔴 CRITIQUE" if stats.error_rate > 20 else "🟡 ATTENTION" if stats.error_rate > 10 else "🟢 OK"
 
-    prompt = f"""Tu es le chef de logistique d'un restaurant. Analyse ces données et génère 3-5 recommandations URGENTES et ACTIONNABLES.
+    return f"""Tu es le chef de logistique d'un restaurant. Analyse ces données et génère 3-5 recommandations URGENTES et ACTIONNABLES.
 
 📊 DONNÉES:
 • {stats.total_orders} commandes | {stats.complete_orders} complètes | {stats.error_rate:.1f}% erreurs {error_severity}
@@ -193,6 +153,36 @@ Exemple: "🔴 CRITIQUE: Sauce oubliée 15x → Former équipe 12h-14h"
 
 Génère maintenant les recommandations les plus importantes."""
 
+
+async def generate_dashboard_insights(
+    stats: Statistics,
+    records: list[ValidationRecord],
+    provider: Provider | None = None,
+    model_id: str | None = None,
+    api_key: SecretStr | None = None,
+) -> str:
+    """Generate AI-powered insights and recommendations for dashboard.
+
+    Args:
+        stats: Calculated statistics from validation records.
+        records: List of validation records for analysis.
+        provider: Provider to use (passed from sync function where session state is available).
+        model_id: Model ID to use (passed from sync function where session state is available).
+        api_key: API key override (passed from sync function where session state is available).
+
+    Returns:
+        Generated insights text in French with recommendations.
+
+    Raises:
+        ValueError: If insight generation fails.
+    """
+    if not records:
+        return "📊 Aucune donnée disponible pour générer des recommandations."
+
+    client = get_client(Capability.TEXT_GENERATION, provider, model_id, usable_api_key(api_key))
+
+    prompt = _build_insights_prompt(stats, records)
+
     output = await client.generate(prompt=prompt)
 
     if hasattr(output, "content"):
@@ -207,21 +197,68 @@ Génère maintenant les recommandations les plus importantes."""
     return insights.strip()
 
 
-def generate_dashboard_insights_sync(
+async def stream_dashboard_insights(
     stats: Statistics,
     records: list[ValidationRecord],
-) -> str:
-    """Generate dashboard insights (sync wrapper for Streamlit).
+    provider: Provider | None = None,
+    model_id: str | None = None,
+    api_key: SecretStr | None = None,
+) -> AsyncGenerator[str]:
+    """Stream AI-powered insights for the dashboard as the model produces them.
+
+    Falls back to a single chunk when the model does not support streaming.
 
     Args:
         stats: Calculated statistics from validation records.
         records: List of validation records for analysis.
+        provider: Provider to use (passed from sync function where session state is available).
+        model_id: Model ID to use (passed from sync function where session state is available).
+        api_key: API key override (passed from sync function where session state is available).
 
-    Returns:
-        Generated insights text in French with recommendations.
+    Yields:
+        Successive pieces of the insights text.
 
     Raises:
-        ValueError: If insight generation fails.
+        ValueError: If insight generation produces no text.
+    """
+    if not records:
+        yield "📊 Aucune donnée disponible pour générer des recommandations."
+        return
+
+    client = get_client(Capability.TEXT_GENERATION, provider, model_id, usable_api_key(api_key))
+    prompt = _build_insights_prompt(stats, records)
+
+    try:
+        stream = client.stream(prompt=prompt)
+    except StreamingNotSupportedError:
+        yield await generate_dashboard_insights(
+            stats, records, provider=provider, model_id=model_id, api_key=api_key
+        )
+        return
+
+    produced = False
+    async for chunk in stream:
+        if chunk.content:
+            produced = True
+            yield str(chunk.content)
+
+    if not produced:
+        msg = "Failed to generate dashboard insights"
+        raise ValueError(msg)
+
+
+def stream_dashboard_insights_sync(
+    stats: Statistics,
+    records: list[ValidationRecord],
+) -> Iterator[str]:
+    """Stream dashboard insights (sync wrapper for Streamlit, e.g. st.write_stream).
+
+    Args:
+        stats: Calculated statistics from validation records.
+        records: List of validation records for analysis.
+
+    Returns:
+        Iterator over pieces of the insights text, produced on the background loop.
     """
     from ui.utils import runner
 
@@ -232,16 +269,16 @@ def generate_dashboard_insights_sync(
         default_model="gemini-2.5-flash-lite",
     )
 
-    # Pass config to async function (runs in background thread without session state access)
-    return runner.run(
-        generate_dashboard_insights(
+    # Pass config to async generator (runs in background thread without session state access)
+    return runner.iterate(
+        stream_dashboard_insights(
             stats,
             records,
             provider=provider,
             model_id=model.id,
             api_key=api_key,
         )
-    )  # type: ignore[no-any-return]
+    )
 
 
 async def generate_validation_explanation_audio_async(
@@ -266,18 +303,7 @@ async def generate_validation_explanation_audio_async(
     Raises:
         ValueError: If audio generation fails.
     """
-    client_kwargs: dict[str, Any] = {
-        "capability": Capability.SPEECH_GENERATION,
-        "provider": provider,
-        "model": model_id,
-    }
-    # Only add api_key if it's provided and non-empty (empty SecretStr prevents env var fallback)
-    if api_key is not None:
-        api_key_value = api_key.get_secret_value()
-        if api_key_value and api_key_value.strip():
-            client_kwargs["api_key"] = api_key
-
-    client = create_client(**client_kwargs)
+    client = get_client(Capability.SPEECH_GENERATION, provider, model_id, usable_api_key(api_key))
 
     output = await client.generate(
         prompt=explanation_text,
@@ -336,21 +362,20 @@ async def generate_validation_explanation_audio_async(
     raise ValueError(msg)
 
 
-def generate_validation_explanation_audio(
+def submit_validation_explanation_audio(
     explanation_text: str,
     language: Language = Language.FRENCH,
-) -> AudioArtifact | bytes:
-    """Generate audio from explanation text (sync wrapper for Streamlit).
+) -> Future[AudioArtifact | bytes]:
+    """Start generating audio for an explanation without waiting for it.
+
+    Must be called from the Streamlit script thread, which holds the session config.
 
     Args:
         explanation_text: Text explanation to convert to speech.
         language: Language for the explanation (default: French).
 
     Returns:
-        AudioArtifact with mime_type and metadata, or bytes if AudioArtifact not available.
-
-    Raises:
-        ValueError: If audio generation fails.
+        Future resolving to the AudioArtifact or bytes.
     """
     from ui.utils import runner
 
@@ -362,7 +387,7 @@ def generate_validation_explanation_audio(
     )
 
     # Pass config to async function (runs in background thread without session state access)
-    return runner.run(
+    return runner.submit(
         generate_validation_explanation_audio_async(
             explanation_text,
             language,
@@ -370,7 +395,26 @@ def generate_validation_explanation_audio(
             model_id=model.id,
             api_key=api_key,
         )
-    )  # type: ignore[no-any-return]
+    )
+
+
+def generate_validation_explanation_audio(
+    explanation_text: str,
+    language: Language = Language.FRENCH,
+) -> AudioArtifact | bytes:
+    """Generate audio from explanation text (sync wrapper for Streamlit).
+
+    Args:
+        explanation_text: Text explanation to convert to speech.
+        language: Language for the explanation (default: French).
+
+    Returns:
+        AudioArtifact with mime_type and metadata, or bytes if AudioArtifact not available.
+
+    Raises:
+        ValueError: If audio generation fails.
+    """
+    return submit_validation_explanation_audio(explanation_text, language).result()
 
 
 __all__ = [
@@ -379,5 +423,7 @@ __all__ = [
     "generate_validation_explanation_audio",
     "generate_validation_explanation_audio_async",
     "generate_dashboard_insights",
-    "generate_dashboard_insights_sync",
+    "stream_dashboard_insights",
+    "stream_dashboard_insights_sync",
+    "submit_validation_explanation_audio",
 ]
@@ -1,18 +1,19 @@
 """Service layer for order prediction using Celeste image intelligence."""
 
+import asyncio
 import io
 
 from PIL import Image
 
-from typing import Any
-
 from pydantic import SecretStr
 
-from celeste import create_client
 from celeste.artifacts import ImageArtifact
 from celeste.core import Capability, Provider
 from staff_meal.models import Item, Order
-from ui.services.client_config import get_client_config
+from ui.services.client_config import get_client, get_client_config, usable_api_key
+
+_DEFAULT_PROVIDER = "google"
+_DEFAULT_MODEL = "gemini-2.5-flash-lite"
 
 
 async def predict_order_async(
@@ -47,18 +48,7 @@ async def predict_order_async(
 
     image_artifact = ImageArtifact(data=img_bytes.read())
 
-    client_kwargs: dict[str, Any] = {
-        "capability": Capability.IMAGE_INTELLIGENCE,
-        "provider": provider,
-        "model": model_id,
-    }
-    # Only add api_key if it's provided and non-empty (empty SecretStr prevents env var fallback)
-    if api_key is not None:
-        api_key_value = api_key.get_secret_value()
-        if api_key_value and api_key_value.strip():
-            client_kwargs["api_key"] = api_key
-
-    client = create_client(**client_kwargs)
+    client = get_client(Capability.IMAGE_INTELLIGENCE, provider, model_id, usable_api_key(api_key))
 
     prompt_parts = [
         "You are analyzing a restaurant order bag image to verify that all items are present.",
@@ -134,8 +124,8 @@ def predict_order(bag_image: Image.Image, expected_order: Order | None = None) -
     # Read config in main thread where session state is available
     provider, model, api_key = get_client_config(
         Capability.IMAGE_INTELLIGENCE,
-        default_provider="google",
-        default_model="gemini-2.5-flash-lite",
+        default_provider=_DEFAULT_PROVIDER,
+        default_model=_DEFAULT_MODEL,
     )
 
     # Pass config to async function (runs in background thread without session state access)
@@ -150,4 +140,32 @@ def predict_order(bag_image: Image.Image, expected_order: Order | None = None) -
     )  # type: ignore[no-any-return]
 
 
-__all__ = ["predict_order", "predict_order_async"]
+def warm_up_prediction_client() -> None:
+    """Create the prediction client in the background ahead of the first bag image.
+
+    Meant to be called once the QR code is read, so client setup overlaps with
+    the user taking the bag photo. Failures (e.g. missing credentials) are left
+    for predict_order to report.
+    """
+    from ui.utils import runner
+
+    try:
+        provider, model, api_key = get_client_config(
+            Capability.IMAGE_INTELLIGENCE,
+            default_provider=_DEFAULT_PROVIDER,
+            default_model=_DEFAULT_MODEL,
+        )
+    except ValueError:
+        return
+    runner.submit(
+        asyncio.to_thread(
+            get_client,
+            Capability.IMAGE_INTELLIGENCE,
+            provider,
+            model.id,
+            usable_api_key(api_key),
+        )
+    )
+
+
+__all__ = ["predict_order", "predict_order_async", "warm_up_prediction_client"]
@@ -125,10 +125,7 @@ def get_statistics_by_operator(records: list[ValidationRecord]) -> dict[str, Sta
     operators: dict[str, list[ValidationRecord]] = {}
 
     for record in records:
-        operator_name = record.operator or "Non spécifié"
-        if operator_name not in operators:
-            operators[operator_name] = []
-        operators[operator_name].append(record)
+        operators.setdefault(record.operator or "Non spécifié", []).append(record)
 
     return {op: calculate_statistics(op_records) for op, op_records in operators.items()}
 
@@ -142,15 +139,10 @@ def get_statistics_by_source(records: list[ValidationRecord]) -> dict[str, Stati
     Returns:
         Dictionary mapping source name to Statistics object.
     """
-    from staff_meal.models import OrderSource
-
     sources: dict[str, list[ValidationRecord]] = {}
 
     for record in records:
-        source_name = record.expected_order.source.value
-        if source_name not in sources:
-            sources[source_name] = []
-        sources[source_name].append(record)
+        sources.setdefault(record.expected_order.source.value, []).append(record)
 
     return {source: calculate_statistics(source_records) for source, source_records in sources.items()}
 
@@ -13,10 +13,7 @@ def compare_orders(expected: Order, detected: Order) -> ComparisonResult:
     Returns:
         ComparisonResult with comparison details.
     """
-    # Build detected items dict for quick lookup
-    detected_items: dict[str, int] = {}
-    for item in detected.items:
-        detected_items[item.item.value] = item.quantity
+    detected_items = detected.items_by_name()
 
     # Compare each expected item
     missing_items: list[ItemMismatch] = []
@@ -70,7 +67,7 @@ def compare_orders(expected: Order, detected: Order) -> ComparisonResult:
                 )
 
     # Check for extra items (detected but not expected)
-    expected_item_names = {item.item.value for item in expected.items}
+    expected_item_names = expected.items_by_name().keys()
     extra_items: list[OrderItem] = [
         item for item in detected.items if item.item.value not in expected_item_names
     ]
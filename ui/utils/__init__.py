@@ -2,10 +2,12 @@
 
 import asyncio
 import threading
+from collections.abc import AsyncGenerator, Iterator
+from concurrent.futures import Future
 from typing import Any
 
 from celeste.core import Provider
-from ui.utils.image import pil_image_to_bytes
+from ui.utils.image import image_fingerprint, pil_image_to_bytes
 
 
 class AsyncRunner:
@@ -24,16 +26,17 @@ class AsyncRunner:
     def _start_loop(self) -> None:
         """Start event loop in background thread."""
 
+        ready = threading.Event()
+
         def run_loop() -> None:
             self.loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self.loop)
+            self.loop.call_soon(ready.set)
             self.loop.run_forever()
 
         thread = threading.Thread(target=run_loop, daemon=True)
         thread.start()
-
-        while self.loop is None:
-            pass
+        ready.wait()
 
     def run(self, coro: Any) -> Any:  # noqa: ANN401
         """Submit coroutine to background loop and return result.
@@ -44,11 +47,44 @@ class AsyncRunner:
         Returns:
             Result from coroutine execution.
         """
+        return self.submit(coro).result()
+
+    def submit(self, coro: Any) -> Future[Any]:  # noqa: ANN401
+        """Schedule coroutine on background loop without waiting for it.
+
+        Args:
+            coro: Coroutine to execute in background loop.
+
+        Returns:
+            Future resolving to the coroutine result.
+        """
         if self.loop is None:
             msg = "Event loop not initialized"
             raise RuntimeError(msg)
-        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
-        return future.result()
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def iterate(self, agen: AsyncGenerator[Any]) -> Iterator[Any]:
+        """Consume an async generator on the background loop, yielding items as they arrive.
+
+        The generator is closed on the background loop when the consumer stops
+        early, so provider streams are not left open.
+
+        Args:
+            agen: Async generator to drain in background loop.
+
+        Yields:
+            Items produced by the async generator, in order.
+        """
+        done = object()
+
+        async def next_item() -> Any:  # noqa: ANN401
+            return await anext(agen, done)
+
+        try:
+            while (item := self.run(next_item())) is not done:
+                yield item
+        finally:
+            self.run(agen.aclose())
 
 
 def get_provider_favicon_url(provider: Provider) -> str:
@@ -88,4 +124,4 @@ def get_provider_favicon_url(provider: Provider) -> str:
 
 runner = AsyncRunner()
 
-__all__ = ["AsyncRunner", "get_provider_favicon_url", "runner", "pil_image_to_bytes"]
+__all__ = ["AsyncRunner", "get_provider_favicon_url", "image_fingerprint", "runner", "pil_image_to_bytes"]
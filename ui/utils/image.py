@@ -1,24 +1,53 @@
 """Image utility functions for UI components."""
 
+import hashlib
 import io
+from typing import Any
 
 from PIL import Image
 
+# Key under which decoders store the fingerprint of the source bytes in Image.info
+FINGERPRINT_INFO_KEY = "staff_meal_fingerprint"
 
-def pil_image_to_bytes(image: Image.Image, format: str = "PNG") -> io.BytesIO:
+
+def pil_image_to_bytes(image: Image.Image, format: str = "PNG", **params: Any) -> io.BytesIO:  # noqa: ANN401
     """Convert PIL Image to bytes buffer for Streamlit.
 
     Args:
         image: PIL Image object to convert.
         format: Image format (default: PNG).
+        **params: Extra encoder options passed to Image.save (e.g. compress_level).
 
     Returns:
         BytesIO buffer with image data, positioned at start.
     """
     img_bytes = io.BytesIO()
-    image.save(img_bytes, format=format)
+    image.save(img_bytes, format=format, **params)
     img_bytes.seek(0)
     return img_bytes
 
 
-__all__ = ["pil_image_to_bytes"]
+def image_fingerprint(image: Image.Image | bytes) -> str:
+    """Compute a content fingerprint of an image without re-encoding it.
+
+    Raw upload bytes are hashed as-is. For a PIL Image, a fingerprint stored
+    in ``image.info`` at decode time is reused; otherwise the raw pixel buffer
+    is hashed together with mode and size, which skips the PNG compression
+    pass an encode-then-hash approach would pay.
+
+    Args:
+        image: PIL Image object or encoded image bytes to fingerprint.
+
+    Returns:
+        Hex digest identifying the image contents.
+    """
+    if isinstance(image, bytes):
+        return hashlib.blake2b(image, digest_size=16).hexdigest()
+    if FINGERPRINT_INFO_KEY in image.info:
+        return str(image.info[FINGERPRINT_INFO_KEY])
+    digest = hashlib.blake2b(image.tobytes(), digest_size=16)
+    digest.update(f"{image.mode}:{image.size}".encode())
+    return digest.hexdigest()
+
+
+__all__ = ["FINGERPRINT_INFO_KEY", "image_fingerprint", "pil_image_to_bytes"]